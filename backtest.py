@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+"""
+Vectorized backtest engine for indicator x transform strategies
+
+Prices and indicator series are read from local CSV or Parquet files in
+market_data/ (first column = date, one column per series; FRED's "." marks a
+missing value). Every indicator is run through every signal rule in
+TRANSFORMS (the transform_type values shown in the dashboard), and the
+resulting positions, returns and metrics (metrics.py) are computed for all
+strategies at once: arrays are strategies x days, and nothing loops over
+strategies in Python.
+
+Positions are decided on a day's close and earn the next day's asset return,
+less COST_PER_TRADE per unit of position change.
+
+Running the script backtests the full grid, replaces individualData in
+dashboard_data.json with the results and saves the daily strategy returns
+(market_data/strategy_returns.npy, rows described by strategy_returns.json) for
+the generators in create_complete_data.py.
+"""
+
+import csv
+import hashlib
+import json
+import os
+
+import numpy as np
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+from dashboard_io import DashboardWriter, iter_sections
+from metrics import PERIODS_PER_YEAR, batch_metrics
+from strategy_table import StrategyTable
+
+MARKET_DATA_DIR = 'market_data'
+PRICES_NAME = 'prices'          # prices.csv / prices.parquet
+INDICATORS_NAME = 'indicators'  # indicators.csv / indicators.parquet
+RETURNS_FILE = 'strategy_returns.npy'
+RETURNS_LABELS_FILE = 'strategy_returns.json'
+ASSET = 'SPY'
+
+WINDOW = 20
+COST_PER_TRADE = 0.0005
+CHUNK_SIZE = 1024  # strategies per vectorized batch; bounds memory on large grids
+
+# ---------------------------------------------------------------------------
+# Loading
+# ---------------------------------------------------------------------------
+
+def _find(directory, name):
+    for extension in ('parquet', 'csv'):
+        path = os.path.join(directory, f"{name}.{extension}")
+        if os.path.exists(path):
+            return path
+    return None
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan  # "", ".", "NA", ...
+
+def load_series(path):
+    """Read a date-indexed table; returns (dates, {column: float64 array})"""
+    if path.endswith('.parquet'):
+        if pd is None:
+            raise ImportError(f"Reading {path} requires pandas with a Parquet engine (pip install pandas pyarrow)")
+        frame = pd.read_parquet(path)
+        if not isinstance(frame.index, pd.RangeIndex):
+            frame = frame.reset_index()
+        dates = frame.iloc[:, 0].astype(str).to_numpy()
+        return dates, {str(column): pd.to_numeric(frame[column], errors='coerce').to_numpy(dtype=np.float64)
+                       for column in frame.columns[1:]}
+
+    with open(path, 'r', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        rows = [row for row in reader if row]
+    dates = np.array([row[0] for row in rows])
+    columns = {name: np.array([_to_float(row[i]) if i < len(row) else np.nan for row in rows])
+               for i, name in enumerate(header[1:], start=1)}
+    return dates, columns
+
+def forward_fill(matrix):
+    """Carry the last valid value forward along each row (leading NaNs stay NaN)"""
+    matrix = np.atleast_2d(matrix)
+    index = np.where(np.isnan(matrix), 0, np.arange(matrix.shape[1]))
+    np.maximum.accumulate(index, axis=1, out=index)
+    return matrix[np.arange(matrix.shape[0])[:, None], index]
+
+def load_market_data(directory=MARKET_DATA_DIR, asset=ASSET):
+    """Asset prices and indicators aligned on the price dates.
+
+    Returns (dates, prices, indicator names, indicators) with indicators shaped
+    indicators x days, or None when the directory has no price file.
+    """
+    prices_path = _find(directory, PRICES_NAME)
+    if prices_path is None:
+        return None
+    dates, price_columns = load_series(prices_path)
+    prices = price_columns[asset] if asset in price_columns else next(iter(price_columns.values()))
+    order = np.argsort(dates, kind='stable')
+    dates, prices = dates[order], forward_fill(prices[order])[0]
+
+    names, indicators = [], np.empty((0, len(dates)))
+    indicators_path = _find(directory, INDICATORS_NAME)
+    if indicators_path is not None:
+        indicator_dates, columns = load_series(indicators_path)
+        names = list(columns)
+        # Position of each price date in the (sorted) indicator dates, so values carry over gaps
+        indicator_order = np.argsort(indicator_dates, kind='stable')
+        sorted_dates = indicator_dates[indicator_order]
+        stacked = np.vstack([columns[name][indicator_order] for name in names]) if names else indicators
+        positions = np.searchsorted(sorted_dates, dates, side='right') - 1
+        indicators = forward_fill(stacked)[:, np.maximum(positions, 0)]
+        indicators[:, positions < 0] = np.nan
+
+    return dates, prices, names, indicators
+
+def market_data_fingerprint(directory=MARKET_DATA_DIR):
+    """Content hash of every file in the market data directory, or None if there is none"""
+    if not os.path.isdir(directory):
+        return None
+    digest = hashlib.sha256()
+    for filename in sorted(os.listdir(directory)):
+        digest.update(filename.encode('utf-8'))
+        with open(os.path.join(directory, filename), 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+    return digest.hexdigest()
+
+# ---------------------------------------------------------------------------
+# Rolling statistics (row-wise over a strategies x days matrix)
+# ---------------------------------------------------------------------------
+
+def _window_sum(values, window):
+    sums = np.cumsum(values, axis=1, dtype=np.float64)
+    sums[:, window:] -= sums[:, :-window].copy()
+    return sums
+
+def rolling_mean_std(matrix, window):
+    """Trailing mean and sample std over window days; NaN until a full window is available"""
+    valid = ~np.isnan(matrix)
+    values = np.where(valid, matrix, 0.0)
+    count = _window_sum(valid, window)
+    total = _window_sum(values, window)
+    squares = _window_sum(values * values, window)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = total / count
+        std = np.sqrt(np.maximum(squares - total * mean, 0) / (count - 1))
+    mean[count < window] = np.nan
+    std[count < window] = np.nan
+    return mean, std
+
+def rolling_max(matrix, window):
+    """Trailing max over window days (NaN until a full window is available)"""
+    out = np.full(matrix.shape, np.nan)
+    if matrix.shape[1] >= window:
+        out[:, window - 1:] = np.lib.stride_tricks.sliding_window_view(matrix, window, axis=1).max(axis=2)
+    return out
+
+def shift(matrix, days):
+    """Values from `days` days earlier (NaN where there are none)"""
+    out = np.full(matrix.shape, np.nan)
+    out[:, days:] = matrix[:, :-days]
+    return out
+
+def zscore(matrix, window):
+    mean, std = rolling_mean_std(matrix, window)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return (matrix - mean) / std
+
+def hold(enter, exit):
+    """1 from each enter signal until the next exit signal, 0 otherwise (vectorized along time)"""
+    state = np.where(enter, 1.0, np.where(exit, 0.0, np.nan))
+    return np.nan_to_num(forward_fill(state), nan=0.0)
+
+# ---------------------------------------------------------------------------
+# Signal rules: indicator matrix -> long/flat positions (strategies x days)
+# ---------------------------------------------------------------------------
+
+def momentum(indicators, window):
+    """Long while the indicator is above its trailing mean"""
+    with np.errstate(invalid='ignore'):
+        return (zscore(indicators, window) > 0).astype(np.float64)
+
+def mean_reversion(indicators, window):
+    """Long when the indicator is stretched a standard deviation below its mean, until it reverts"""
+    z = zscore(indicators, window)
+    with np.errstate(invalid='ignore'):
+        return hold(z < -1, z > 0)
+
+def contrarian(indicators, window):
+    """Long after the indicator has fallen over the window (fading the recent move)"""
+    with np.errstate(invalid='ignore'):
+        return (indicators - shift(indicators, window) < 0).astype(np.float64)
+
+def breakout(indicators, window):
+    """Long when the indicator exceeds its previous window high, until it drops below its mean"""
+    high = rolling_max(shift(indicators, 1), window)
+    mean, _ = rolling_mean_std(indicators, window)
+    with np.errstate(invalid='ignore'):
+        return hold(indicators > high, indicators < mean)
+
+TRANSFORMS = {
+    'mean_reversion': mean_reversion,
+    'momentum': momentum,
+    'contrarian': contrarian,
+    'breakout': breakout,
+}
+
+# ---------------------------------------------------------------------------
+# Returns and metrics
+# ---------------------------------------------------------------------------
+
+def asset_returns(prices):
+    with np.errstate(invalid='ignore', divide='ignore'):
+        returns = prices[1:] / prices[:-1] - 1
+    return np.nan_to_num(returns, nan=0.0, posinf=0.0, neginf=0.0)
+
+def strategy_returns(positions, returns, cost=COST_PER_TRADE):
+    """Daily returns of each position row: yesterday's position x today's asset return, less costs"""
+    turnover = np.abs(np.diff(positions, axis=1, prepend=0.0))[:, :-1]
+    return positions[:, :-1] * returns - cost * turnover
+
+def trade_stats(positions, daily_returns):
+    """(total_trades, win_rate) per row; a trade runs from entering a position until leaving it"""
+    held = positions[:, :-1] > 0
+    entries = held & ~np.pad(held, ((0, 0), (1, 0)))[:, :-1]
+    total_trades = entries.sum(axis=1)
+
+    # Sum each trade's log returns with one bincount keyed by (row, trade number)
+    rows, days = held.shape
+    trade_ids = np.cumsum(entries, axis=1) + np.arange(rows)[:, None] * (days + 1)
+    pnl = np.bincount(trade_ids[held], weights=np.log1p(daily_returns[held]), minlength=rows * (days + 1))
+    wins = (pnl.reshape(rows, days + 1) > 0).sum(axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        win_rate = np.where(total_trades > 0, wins / total_trades, 0.0)
+    return total_trades.astype(np.int64), win_rate
+
+def backtest(indicators, transform_type, returns, window=WINDOW):
+    """Backtest one signal rule over every indicator row; returns (metrics columns, daily returns)"""
+    positions = TRANSFORMS[transform_type](indicators, window)
+    daily = strategy_returns(positions, returns)
+    total_trades, win_rate = trade_stats(positions, daily)
+    metrics = batch_metrics(daily)
+    metrics['win_rate'] = win_rate
+    metrics['total_trades'] = total_trades
+    metrics['avg_trades_per_year'] = total_trades / (daily.shape[1] / PERIODS_PER_YEAR)
+    return metrics, daily
+
+def run_grid(names, indicators, prices, transforms=None, window=WINDOW, returns_out=None, chunk_size=CHUNK_SIZE):
+    """Backtest every indicator x transform pair.
+
+    Returns a StrategyTable (indicator, transform_type, metrics...) in grid
+    order: transforms outer, indicators inner. returns_out, an optional
+    array-like of shape (strategies, days - 1) such as a np.memmap, receives
+    each strategy's daily returns in the same order.
+    """
+    transforms = list(transforms or TRANSFORMS)
+    returns = asset_returns(prices)
+    columns = {}
+    row = 0
+    for transform_type in transforms:
+        for start in range(0, len(names), chunk_size):
+            metrics, daily = backtest(indicators[start:start + chunk_size], transform_type, returns, window)
+            if returns_out is not None:
+                returns_out[row:row + len(daily)] = daily
+            row += len(daily)
+            for name, values in metrics.items():
+                columns.setdefault(name, []).append(values)
+
+    count = len(names) * len(transforms)
+    return StrategyTable({
+        "indicator": np.array(list(names) * len(transforms), dtype=object),
+        "transform_type": np.repeat(np.array(transforms, dtype=object), len(names)),
+        **{name: np.concatenate(parts) if parts else np.empty(count) for name, parts in columns.items()}
+    })
+
+def benchmark_metrics(prices):
+    """Buy & hold metrics of the asset itself, in the spyBenchmark layout"""
+    returns = asset_returns(prices)[None, :]
+    metrics = {name: float(values[0]) for name, values in batch_metrics(returns).items()}
+    metrics['win_rate'] = float((returns > 0).mean())
+    return metrics
+
+def load_strategy_returns(directory=MARKET_DATA_DIR):
+    """({(indicator, transform_type): row}, memory-mapped daily returns) saved by main(), or None"""
+    labels_path = os.path.join(directory, RETURNS_LABELS_FILE)
+    returns_path = os.path.join(directory, RETURNS_FILE)
+    if not (os.path.exists(labels_path) and os.path.exists(returns_path)):
+        return None
+    with open(labels_path, 'r') as f:
+        strategies = json.load(f)['strategies']
+    rows = {(indicator, transform): row for row, (indicator, transform) in enumerate(strategies)}
+    return rows, np.load(returns_path, mmap_mode='r')
+
+def strategy_positions(strategies, directory=MARKET_DATA_DIR, window=WINDOW):
+    """Positions (strategies x days) of (indicator, transform_type) pairs, recomputed from the market data"""
+    _, _, names, indicators = load_market_data(directory)
+    index = {name: row for row, name in enumerate(names)}
+    return np.vstack([TRANSFORMS[transform](indicators[[index[indicator]]], window)
+                      for indicator, transform in strategies])
+
+# ---------------------------------------------------------------------------
+# Technical indicators derived from the asset's own prices
+# ---------------------------------------------------------------------------
+
+def technical_indicators(prices):
+    """Price-derived series backtested by the technical (SPY) tables"""
+    series = prices[None, :]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        sma20, std20 = rolling_mean_std(series, 20)
+        sma50, _ = rolling_mean_std(series, 50)
+        sma200, _ = rolling_mean_std(series, 200)
+        change = np.diff(series, axis=1, prepend=np.nan)
+        gains, _ = rolling_mean_std(np.maximum(change, 0), 14)
+        losses, _ = rolling_mean_std(np.maximum(-change, 0), 14)
+        indicators = {
+            "SMA20 Gap": series / sma20 - 1,
+            "SMA50 Gap": series / sma50 - 1,
+            "SMA200 Gap": series / sma200 - 1,
+            "RSI14": 100 - 100 / (1 + gains / losses),
+            "ROC10": series / shift(series, 10) - 1,
+            "ROC60": series / shift(series, 60) - 1,
+            "Bollinger %B": (series - (sma20 - 2 * std20)) / (4 * std20),
+        }
+    return list(indicators), np.vstack(list(indicators.values()))
+
+# ---------------------------------------------------------------------------
+
+def replace_section(path, name, value):
+    """Rewrite one section of the data file in place, streaming the others through"""
+    counts = {}
+    with DashboardWriter(path) as writer:
+        for section, existing in iter_sections(path):
+            counts[section] = writer.write_section(section, value if section == name else existing)
+        if name not in counts:
+            counts[name] = writer.write_section(name, value)
+    return counts[name]
+
+def main():
+    print("🔧 Backtesting the indicator x transform grid...")
+
+    market = load_market_data()
+    if market is None or len(market[2]) == 0:
+        print(f"❌ No market data: add {MARKET_DATA_DIR}/{PRICES_NAME}.csv (date,{ASSET}) and "
+              f"{MARKET_DATA_DIR}/{INDICATORS_NAME}.csv (date,<indicator>,...) or .parquet files")
+        return False
+    dates, prices, names, indicators = market
+    print(f"📈 {len(dates)} days ({dates[0]} to {dates[-1]}), {len(names)} indicators x {len(TRANSFORMS)} transforms")
+
+    count = len(names) * len(TRANSFORMS)
+    returns_path = os.path.join(MARKET_DATA_DIR, RETURNS_FILE)
+    returns_out = np.lib.format.open_memmap(returns_path, mode='w+', dtype=np.float64, shape=(count, len(dates) - 1))
+    table = run_grid(names, indicators, prices, returns_out=returns_out)
+    returns_out.flush()
+    del returns_out
+
+    with open(os.path.join(MARKET_DATA_DIR, RETURNS_LABELS_FILE), 'w') as f:
+        json.dump({"dates": [str(dates[1]), str(dates[-1])],
+                   "strategies": [[indicator, transform] for indicator, transform in
+                                  zip(table['indicator'].tolist(), table['transform_type'].tolist())]}, f)
+
+    ranked = table.take(table.argsort('sharpe_ratio', descending=True))
+    written = replace_section('dashboard_data.json', 'individualData', ranked)
+
+    best = next(iter(ranked.head(1)))
+    print(f"💾 Saved {written} strategies to individualData and daily returns to {returns_path}")
+    print(f"🏆 Best: {best['indicator']} {best['transform_type']} (Sharpe {best['sharpe_ratio']:.2f})")
+
+    return True
+
+if __name__ == "__main__":
+    success = main()
+    exit(0 if success else 1)
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Front-end performance benchmark with regression gating
+
+For each size in SIZES, a synthetic site is built in a temporary directory: the
+sections in SCALED_SECTIONS are cycled to that many rows with jittered metrics,
+then sharded, and index.html is pointed at them as build_shards.py would. The
+site is served by verify_dashboard's local static server and loaded in
+headless Chromium, RUNS times per size. Each run measures:
+
+- ready_ms: navigation start to the page's dashboard:ready signal
+- fetch_ms / decode_ms: fetching the scaled shards, and decoding and indexing
+  them as the page does on the main thread
+- fetch_full_ms / parse_ms: fetching and JSON.parse of the single data file
+- initialize_ms: initializeTables() with every section loaded, plus
+  render_<create*Table>_ms for each renderer it calls
+- sort_<table>_ms: clicking through none/asc/desc on every column
+- heap_mb: JS heap in use after a forced garbage collection
+
+Medians per size are appended to HISTORY_FILE. The first run records the
+baseline; later runs fail when a metric exceeds its baseline by more than
+REGRESSION_THRESHOLD (and by more than MIN_REGRESSION in absolute terms,
+so noise on tiny timings does not trip the gate). Delete the "baseline" entry
+to re-baseline after an intended change.
+"""
+
+import asyncio
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import tempfile
+import time
+
+from playwright.async_api import async_playwright
+
+from build_shards import SHARD_DIR, file_hash, update_html_references, write_shards
+from dashboard_io import DashboardWriter, iter_sections
+from seeding import numpy_rng
+from strategy_table import METRIC_COLUMNS, StrategyTable
+from verify_dashboard import READY_TIMEOUT, start_server
+
+SIZES = [1000, 10000, 100000]
+RUNS = 5
+SCALED_SECTIONS = ['individualData', 'combinationData', 'technicalIndividualData', 'technicalCombinationData']
+SORT_TABLES = ['individual', 'combination']
+HISTORY_FILE = 'benchmark_history.json'
+# Medians of RUNS runs of unchanged code differ by up to 1.6x (and ~30ms) between benchmark runs on a
+# one-CPU machine, so only larger slowdowns count as regressions
+REGRESSION_THRESHOLD = 0.75
+MIN_REGRESSION = {'ms': 30.0, 'mb': 2.0}  # by metric suffix
+
+HTML_FILE = 'index.html'
+DATA_FILE = 'dashboard_data.json'
+
+# Runs before any page script: time the readiness signal
+INIT_SCRIPT = """
+document.addEventListener('dashboard:ready', () => { window.__benchReady = performance.now(); });
+"""
+
+BENCHMARK_JS = """async ({ sections, sortTables }) => {
+    const now = () => performance.now();
+    const layout = () => document.body.offsetHeight;
+    const result = { ready_ms: window.__benchReady, fetch_ms: 0, decode_ms: 0 };
+
+    for (const name of sections) {
+        const entry = dataIndex && dataIndex.sections[name];
+        if (!entry) throw new Error(`no shard for ${name} in the data index`);
+        let start = now();
+        const buffer = await (await fetch(entry.file, { cache: 'no-store' })).arrayBuffer();
+        result.fetch_ms += now() - start;
+        start = now();
+        columnarRows(prepareSection(buffer, name));
+        result.decode_ms += now() - start;
+    }
+
+    let start = now();
+    const text = await (await fetch(FULL_DATA_URL, { cache: 'no-store' })).text();
+    result.fetch_full_ms = now() - start;
+    start = now();
+    JSON.parse(text);
+    result.parse_ms = now() - start;
+
+    // Every section in memory, then time the full render and each renderer it calls
+    await Promise.all(Object.keys(SECTION_SETTERS).map(loadSection));
+    const renderers = Object.keys(window).filter(name => /^create\\w*Table$/.test(name) && typeof window[name] === 'function');
+    for (const name of renderers) {
+        const original = window[name];
+        result[`render_${name}_ms`] = 0;
+        window[name] = function() {
+            const begin = now();
+            try { return original.apply(this, arguments); }
+            finally { result[`render_${name}_ms`] += now() - begin; }
+        };
+    }
+    start = now();
+    initializeTables();
+    layout();
+    result.initialize_ms = now() - start;
+
+    for (const tableId of sortTables) {
+        const state = virtualTables[`${tableId}-tbody`];
+        if (!state) throw new Error(`table ${tableId} did not render`);
+        result[`sort_${tableId}_ms`] = 0;
+        for (let column = 0; column < state.sortKeys.length; column++) {
+            for (let click = 0; click < 3; click++) {
+                start = now();
+                sortTable(tableId, column);
+                layout();
+                result[`sort_${tableId}_ms`] += now() - start;
+            }
+        }
+    }
+    return result;
+}"""
+
+def synthetic_data(source_path, output_path, rows):
+    """Copy the data file with the scaled sections cycled to rows, metrics jittered so sorts have work to do"""
+    rng = numpy_rng('benchmark', str(rows))
+    with DashboardWriter(output_path) as writer:
+        for name, value in iter_sections(source_path):
+            if name in SCALED_SECTIONS:
+                table = StrategyTable.from_records(value).cycle(rows)
+                for column in METRIC_COLUMNS:
+                    if column in table and table[column].dtype.kind == 'f':
+                        table[column] = table[column] * rng.uniform(0.9, 1.1, rows)
+                value = table
+            writer.write_section(name, value)
+
+def build_site(site_dir, rows):
+    """Synthetic data, its shards and an index.html pointing at them"""
+    shutil.copy(HTML_FILE, os.path.join(site_dir, HTML_FILE))
+    synthetic_data(DATA_FILE, os.path.join(site_dir, DATA_FILE), rows)
+    cwd = os.getcwd()
+    os.chdir(site_dir)  # shard URLs in the index are relative to the site root
+    try:
+        _, index_file = write_shards(DATA_FILE, SHARD_DIR)
+        update_html_references(HTML_FILE, f"{SHARD_DIR}/{index_file}", f"{DATA_FILE}?v={file_hash(DATA_FILE)}")
+    finally:
+        os.chdir(cwd)
+
+async def measure(browser, base_url):
+    """One benchmark run in a fresh context; returns {metric: value}"""
+    context = await browser.new_context()
+    await context.add_init_script(INIT_SCRIPT)
+    page = await context.new_page()
+    errors = []
+    page.on('pageerror', lambda error: errors.append(str(error)))
+    try:
+        await page.goto(f"{base_url}/{HTML_FILE}", wait_until='domcontentloaded')
+        await page.wait_for_function("document.documentElement.hasAttribute('data-dashboard')", timeout=READY_TIMEOUT * 4)
+        result = await page.evaluate(BENCHMARK_JS, {'sections': SCALED_SECTIONS, 'sortTables': SORT_TABLES})
+
+        cdp = await context.new_cdp_session(page)
+        await cdp.send('HeapProfiler.collectGarbage')
+        heap = await cdp.send('Runtime.getHeapUsage')
+        result['heap_mb'] = heap['usedSize'] / (1024 * 1024)
+    finally:
+        await context.close()
+    if errors:
+        raise RuntimeError(f"page errors: {errors}")
+    return result
+
+async def benchmark_size(browser, rows):
+    with tempfile.TemporaryDirectory(prefix='dashboard-bench-') as site_dir:
+        started = time.perf_counter()
+        build_site(site_dir, rows)
+        print(f"🏗️  {rows:,} rows per scaled section: site built in {time.perf_counter() - started:.1f}s")
+
+        server, base_url = await start_server(os.path.realpath(site_dir))
+        try:
+            runs = [await measure(browser, base_url) for _ in range(RUNS)]
+        finally:
+            server.close()
+            await server.wait_closed()
+
+    names = sorted({name for run in runs for name, value in run.items() if value is not None})
+    return {name: statistics.median(run[name] for run in runs if run.get(name) is not None) for name in names}
+
+def regressions(results, baseline):
+    """[(size, metric, baseline value, value)] exceeding the thresholds"""
+    found = []
+    for size, metrics in results.items():
+        for name, value in metrics.items():
+            base = baseline.get(size, {}).get(name)
+            if base is None:
+                continue
+            slack = MIN_REGRESSION[name.rsplit('_', 1)[-1]]
+            if value > base * (1 + REGRESSION_THRESHOLD) and value - base > slack:
+                found.append((size, name, base, value))
+    return found
+
+def current_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        return None
+
+async def run_benchmarks():
+    results = {}
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(headless=True)
+        try:
+            for rows in SIZES:
+                results[str(rows)] = await benchmark_size(browser, rows)
+        finally:
+            await browser.close()
+    return results
+
+def main():
+    print("🔧 Benchmarking dashboard load, render and sort...")
+
+    results = asyncio.run(run_benchmarks())
+    for size, metrics in results.items():
+        print(f"📊 {int(size):,} rows:")
+        for name, value in metrics.items():
+            print(f"  - {name}: {value:.1f}")
+
+    history = {"baseline": None, "runs": []}
+    if os.path.exists(HISTORY_FILE):
+        with open(HISTORY_FILE, 'r') as f:
+            history = json.load(f)
+
+    found = regressions(results, history['baseline']) if history.get('baseline') else []
+    history['runs'].append({
+        "timestamp": time.strftime('%Y-%m-%dT%H:%M:%S'),
+        "commit": current_commit(),
+        "results": results,
+        "regressions": [f"{size}:{name}" for size, name, _, _ in found],
+    })
+    if not history.get('baseline'):
+        history['baseline'] = results
+        print("📌 No baseline yet; recorded this run as the baseline")
+
+    with open(HISTORY_FILE, 'w') as f:
+        json.dump(history, f, indent=2)
+    print(f"💾 Appended results to {HISTORY_FILE} ({len(history['runs'])} runs)")
+
+    if found:
+        print(f"❌ {len(found)} metrics regressed more than {REGRESSION_THRESHOLD:.0%} against the baseline:")
+        for size, name, base, value in found:
+            print(f"  - {int(size):,} rows {name}: {base:.1f} -> {value:.1f}")
+        return False
+
+    print("✅ No regressions against the baseline")
+    return True
+
+if __name__ == "__main__":
+    success = main()
+    exit(0 if success else 1)
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Fingerprinted cache of generated dashboard sections
+
+Each derived section is keyed by a fingerprint of everything that determines
+it: the source of the generator's module and of every build module it imports
+(directly or through others, e.g. strategy_table, seeding, backtest, metrics),
+its parameters and the fingerprints of the sections it reads. When a fingerprint matches the manifest, the section's
+cached JSON is copied into the output unchanged instead of being regenerated.
+
+Delete the .build_cache directory to force a full rebuild.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import sys
+
+CACHE_DIR = '.build_cache'
+MANIFEST_FILE = 'manifest.json'
+BUILD_DIR = os.path.dirname(os.path.abspath(__file__))
+
+_source_fingerprints = {}
+
+def fingerprint(*parts):
+    """Stable hash of JSON-serializable parts"""
+    payload = json.dumps(parts, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def data_fingerprint(value):
+    """Fingerprint of a section's data as it is serialized to the data file"""
+    payload = json.dumps(value, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def _build_modules(module, found):
+    """Add the files of module and the build modules (files in BUILD_DIR) it imports, transitively, to found"""
+    path = getattr(module, '__file__', None)
+    if not path or os.path.dirname(os.path.abspath(path)) != BUILD_DIR or os.path.basename(path) in found:
+        return
+    # Keyed by file name: a script run directly is __main__, but hashes the same as when imported
+    found[os.path.basename(path)] = path
+    for value in list(vars(module).values()):
+        # "import x" binds the module, "from x import y" an object whose __module__ names it
+        imported = value if inspect.ismodule(value) else sys.modules.get(getattr(value, '__module__', None) or '')
+        if imported is not None:
+            _build_modules(imported, found)
+
+def source_fingerprint(module):
+    """Hash of the source files of module and every build module it depends on"""
+    if module.__name__ not in _source_fingerprints:
+        found = {}
+        _build_modules(module, found)
+        digest = hashlib.sha256()
+        for name in sorted(found):  # file names
+            with open(found[name], 'rb') as f:
+                digest.update(name.encode('utf-8') + b'\0' + hashlib.sha256(f.read()).digest())
+        _source_fingerprints[module.__name__] = digest.hexdigest()
+    return _source_fingerprints[module.__name__]
+
+def recipe_fingerprint(build, params, input_fingerprints):
+    """Fingerprint of a generated section: build sources + generator name + parameters + inputs"""
+    source = source_fingerprint(inspect.getmodule(build))
+    return fingerprint(build.__name__, source, params, input_fingerprints)
+
+
+class BuildCache:
+    """Manifest of {section: {"fingerprint", "count"}} plus one JSON file per section"""
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.manifest_path = os.path.join(cache_dir, MANIFEST_FILE)
+        self.entries = {}
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, 'r') as f:
+                self.entries = json.load(f)
+
+    def path(self, name):
+        return os.path.join(self.cache_dir, f"{name}.json")
+
+    def lookup(self, name, section_fingerprint):
+        """Return the cached entry if it is still fresh, else None"""
+        entry = self.entries.get(name)
+        if entry and entry['fingerprint'] == section_fingerprint and os.path.exists(self.path(name)):
+            return entry
+        return None
+
+    def load(self, name):
+        with open(self.path(name), 'r') as f:
+            return json.load(f)
+
+    def record(self, name, section_fingerprint, count):
+        self.entries[name] = {"fingerprint": section_fingerprint, "count": count}
+
+    def save(self):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = f"{self.manifest_path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.entries, f, indent=2)
+        os.replace(tmp_path, self.manifest_path)
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Assemble the deployable site in dist/ with minified HTML and precompressed files
+
+Copies index.html (with its inline CSS/JS minified), the current data shards and
+the fallback dashboard_data.json into dist/, writes .gz and .br siblings for each
+so static hosting can serve them directly, and checks every artifact against the
+byte budgets in size_budget.json. The build fails when a budget is exceeded.
+
+Run build_shards.py first so index.html points at the current data index, then
+prerender_tables.py so its pre-rendered rows match that data.
+"""
+
+import fnmatch
+import gzip
+import json
+import os
+import re
+import shutil
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+DIST_DIR = 'dist'
+BUDGET_FILE = 'size_budget.json'
+REPORT_FILE = 'size_report.json'
+
+def minify_css(css):
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.DOTALL)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};:,>])\s*', r'\1', css)
+    return css.replace(';}', '}').strip()
+
+def minify_js(js):
+    """Line-level JS minification: drop indentation, blank lines and whole-line comments.
+
+    Statements are never joined, so automatic semicolon insertion is unaffected.
+    """
+    lines = []
+    for line in js.split('\n'):
+        line = line.strip()
+        if line and not line.startswith('//'):
+            lines.append(line)
+    return '\n'.join(lines)
+
+def minify_html(html):
+    """Minify inline <style> and <script> blocks and collapse whitespace between tags"""
+    parts = re.split(r'(<style[^>]*>.*?</style>|<script[^>]*>.*?</script>)', html, flags=re.DOTALL | re.IGNORECASE)
+    output = []
+    for part in parts:
+        block = re.match(r'(<(style|script)[^>]*>)(.*?)(</\2>)$', part, flags=re.DOTALL | re.IGNORECASE)
+        if block:
+            open_tag, tag, body, close_tag = block.groups()
+            body = minify_css(body) if tag.lower() == 'style' else minify_js(body)
+            output.append(f"{open_tag}{body}{close_tag}")
+        else:
+            output.append(re.sub(r'\s+', ' ', re.sub(r'>\s+<', '> <', part)))
+    return ''.join(output).strip()
+
+def data_references(html):
+    """Data files index.html loads: the hashed index, its shards and the fallback file"""
+    index_url = re.search(r"const DATA_INDEX_URL = '([^']*)';", html).group(1)
+    data_url = re.search(r"const FULL_DATA_URL = '([^']*)';", html).group(1).split('?')[0]
+    with open(index_url, 'r') as f:
+        index = json.load(f)
+    return [index_url, data_url] + [entry['file'] for entry in index['sections'].values()]
+
+def compress(path):
+    """Write .gz (and .br when the brotli module is installed) next to path"""
+    with open(path, 'rb') as f:
+        payload = f.read()
+    sizes = {"raw": len(payload)}
+
+    # mtime=0 keeps the .gz bytes identical across builds of identical input
+    gz_payload = gzip.compress(payload, compresslevel=9, mtime=0)
+    with open(f"{path}.gz", 'wb') as f:
+        f.write(gz_payload)
+    sizes['gzip'] = len(gz_payload)
+
+    if brotli is not None:
+        br_payload = brotli.compress(payload, quality=11)
+        with open(f"{path}.br", 'wb') as f:
+            f.write(br_payload)
+        sizes['brotli'] = len(br_payload)
+
+    return sizes
+
+def load_budgets(path=BUDGET_FILE):
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def check_budgets(report, budgets):
+    """Return a list of budget violations; patterns are fnmatch globs on dist paths"""
+    violations = []
+    for artifact, sizes in report.items():
+        for pattern, limits in budgets.items():
+            if not fnmatch.fnmatch(artifact, pattern):
+                continue
+            for encoding, limit in limits.items():
+                if encoding in sizes and sizes[encoding] > limit:
+                    violations.append(f"{artifact} {encoding} {sizes[encoding]} bytes > budget {limit} (from {pattern})")
+    return violations
+
+def build_dist(html_file='index.html', dist_dir=DIST_DIR):
+    """Assemble dist/ and return {artifact: {"raw": n, "gzip": n, "brotli": n}}"""
+    if os.path.isdir(dist_dir):
+        shutil.rmtree(dist_dir)
+    os.makedirs(dist_dir)
+
+    with open(html_file, 'r') as f:
+        html = f.read()
+
+    report = {}
+    with open(os.path.join(dist_dir, html_file), 'w') as f:
+        f.write(minify_html(html))
+    report[html_file] = compress(os.path.join(dist_dir, html_file))
+
+    for artifact in data_references(html):
+        target = os.path.join(dist_dir, artifact)
+        os.makedirs(os.path.dirname(target) or dist_dir, exist_ok=True)
+        shutil.copyfile(artifact, target)
+        report[artifact] = compress(target)
+
+    with open(os.path.join(dist_dir, REPORT_FILE), 'w') as f:
+        json.dump(report, f, indent=2)
+
+    return report
+
+def main():
+    print("🔧 Building minified, precompressed site in dist/...")
+
+    if brotli is None:
+        print("⚠️  brotli module not installed; skipping .br files (pip install brotli)")
+
+    report = build_dist('index.html')
+
+    print(f"📏 Size report ({DIST_DIR}/{REPORT_FILE}):")
+    for artifact, sizes in report.items():
+        details = ', '.join(f"{encoding} {size/1024:.1f}KB" for encoding, size in sizes.items())
+        print(f"  - {artifact}: {details}")
+
+    violations = check_budgets(report, load_budgets())
+    if violations:
+        print("❌ Size budget exceeded:")
+        for violation in violations:
+            print(f"  - {violation}")
+        return False
+
+    print("✅ All artifacts within size budget")
+    return True
+
+if __name__ == "__main__":
+    success = main()
+    exit(0 if success else 1)
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Profile the data build stage by stage
+
+Running this script runs the whole build (pipeline()) with profiling enabled and
+records, for every stage and nested sub-stage:
+
+- wall and CPU time
+- the process's peak RSS at the end of the stage, and how much the stage raised it
+- peak traced Python memory and the top allocating source lines (tracemalloc)
+
+Sub-stages come from stage() blocks in the build scripts: loading, each section
+generator (timed inside its worker process), dumping, and each normalization
+pass and section. Normalization passes normally run fused in one streaming
+pass, so here they run one at a time (the output is identical) to be timed
+separately.
+
+The report is written to REPORT_FILE (JSON). FOLDED_FILE gets the same stages
+as folded stacks ("build;create_complete_data;generate;spyMLData <self µs>"),
+which flamegraph.pl, speedscope and similar tools read directly.
+
+stage() costs nothing while profiling is off, which it is for the normal build
+scripts.
+"""
+
+import json
+import os
+import resource
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+REPORT_FILE = 'build_profile.json'
+FOLDED_FILE = 'build_profile.folded'
+TOP_ALLOCATORS = 5
+ROOT_STAGE = 'build'
+
+_profiler = None
+
+def _peak_rss_mb():
+    # ru_maxrss is in KB on Linux (bytes on macOS)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if os.uname().sysname == 'Darwin' else peak / 1024
+
+
+class StageProfiler:
+    """Records nested stages as flat dicts with a ';'-joined path"""
+
+    def __init__(self, top_allocators=TOP_ALLOCATORS):
+        self.top_allocators = top_allocators
+        self.records = []
+        self.path = []
+        self.child_peaks = []  # per open stage: highest traced peak of its finished children
+        self.overheads = []  # per open stage: (wall, CPU) seconds its children spent in tracemalloc snapshots
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextmanager
+    def stage(self, name):
+        self.path.append(name)
+        self.child_peaks.append(0)
+        self.overheads.append((0, 0))
+        clock = time.perf_counter(), time.process_time()
+        snapshot = tracemalloc.take_snapshot() if self.top_allocators else None
+        rss_before = _peak_rss_mb()
+        tracemalloc.reset_peak()
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield self
+        finally:
+            child_wall, child_cpu = self.overheads.pop()
+            wall = time.perf_counter() - wall - child_wall
+            cpu = time.process_time() - cpu - child_cpu
+            traced_peak = max(tracemalloc.get_traced_memory()[1], self.child_peaks.pop())
+            record = {
+                "stage": ';'.join(self.path),
+                "wall_s": wall,
+                "cpu_s": cpu,
+                "peak_rss_mb": _peak_rss_mb(),
+                "rss_growth_mb": _peak_rss_mb() - rss_before,
+                "traced_peak_mb": traced_peak / (1024 * 1024),
+                "pid": os.getpid(),
+            }
+            if snapshot is not None:
+                record["top_allocators"] = self._top_allocators(snapshot)
+            self.records.append(record)
+            self.path.pop()
+            if self.child_peaks:
+                self.child_peaks[-1] = max(self.child_peaks[-1], traced_peak)
+                # Time outside this stage's own measurement (snapshots) is not charged to the parent
+                parent_wall, parent_cpu = self.overheads[-1]
+                self.overheads[-1] = (parent_wall + time.perf_counter() - clock[0] - wall,
+                                      parent_cpu + time.process_time() - clock[1] - cpu)
+            tracemalloc.reset_peak()
+
+    def _top_allocators(self, before):
+        filters = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+        after = tracemalloc.take_snapshot().filter_traces(filters)
+        diffs = after.compare_to(before.filter_traces(filters), 'lineno')
+        grown = [diff for diff in diffs if diff.size_diff > 0][:self.top_allocators]
+        return [{
+            "where": f"{diff.traceback[0].filename}:{diff.traceback[0].lineno}",
+            "size_kb": diff.size_diff / 1024,
+            "count": diff.count_diff,
+        } for diff in grown]
+
+    def add(self, records, parent=None):
+        """Adopt stages recorded elsewhere (e.g. in a worker process) under parent (default: the open stage)"""
+        prefix = ';'.join(self.path if parent is None else [*self.path, parent])
+        for record in records:
+            self.records.append(dict(record, stage=f"{prefix};{record['stage']}" if prefix else record['stage']))
+
+
+def enable(top_allocators=TOP_ALLOCATORS):
+    """Start profiling this process; returns the profiler"""
+    global _profiler
+    _profiler = StageProfiler(top_allocators)
+    return _profiler
+
+def disable():
+    global _profiler
+    records = _profiler.records if _profiler else []
+    _profiler = None
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+    return records
+
+def enabled():
+    return _profiler is not None
+
+def stage(name):
+    """Context manager timing one build stage (no-op unless profiling is enabled)"""
+    return _profiler.stage(name) if _profiler else nullcontext()
+
+def add_records(records, parent=None):
+    if _profiler and records:
+        _profiler.add(records, parent)
+
+def folded_stacks(records):
+    """Flamegraph folded lines: stage path and self wall time in microseconds.
+
+    Stages run in parallel worker processes can add up to more than their
+    parent's wall time; self time is clamped at zero.
+    """
+    children = {}
+    for record in records:
+        parent = record['stage'].rpartition(';')[0]
+        children[parent] = children.get(parent, 0) + record['wall_s']
+    lines = []
+    for record in records:
+        self_time = max(record['wall_s'] - children.get(record['stage'], 0), 0)
+        lines.append(f"{record['stage']} {round(self_time * 1e6)}")
+    return lines
+
+def write_report(records, report_file=REPORT_FILE, folded_file=FOLDED_FILE):
+    ordered = sorted(records, key=lambda record: record['stage'])
+    with open(report_file, 'w') as f:
+        json.dump({"created": time.strftime('%Y-%m-%dT%H:%M:%S'), "stages": ordered}, f, indent=2)
+    with open(folded_file, 'w') as f:
+        f.write('\n'.join(folded_stacks(ordered)) + '\n')
+
+# ---------------------------------------------------------------------------
+
+def _normalize_pass(pass_name):
+    from normalize_fields import normalize_file
+    return lambda: normalize_file('dashboard_data.json', passes=[pass_name]) is not None
+
+def pipeline():
+    """(stage name, step) for the build in order; steps return False on failure"""
+    import build_dist
+    import build_shards
+    import create_complete_data
+    import data_schema
+    import prerender_tables
+    from normalize_fields import PASS_ORDER
+
+    return [
+        ('create_complete_data', create_complete_data.main),
+        *[(f'normalize_{pass_name}', _normalize_pass(pass_name)) for pass_name in PASS_ORDER],
+        ('validate', data_schema.main),
+        ('build_shards', build_shards.main),
+        ('prerender_tables', prerender_tables.main),
+        ('build_dist', build_dist.main),
+    ]
+
+def main():
+    print("🔧 Profiling the data build...")
+
+    # The build scripts import this module by name; when run as a script this
+    # is __main__, so profile through that imported copy
+    import build_profile as profile
+
+    steps = pipeline()
+    profile.enable()
+    success = True
+    try:
+        with profile.stage(ROOT_STAGE):
+            for name, step in steps:
+                with profile.stage(name):
+                    if not step():
+                        print(f"❌ {name} failed")
+                        success = False
+                        break
+    finally:
+        records = profile.disable()
+
+    write_report(records)
+    top_level = [r for r in records if r['stage'].count(';') == 1]
+    print(f"\n⏱️  Build profile ({len(records)} stages):")
+    for record in sorted(top_level, key=lambda r: r['wall_s'], reverse=True):
+        print(f"  - {record['stage'].split(';')[-1]}: {record['wall_s']:.2f}s wall, {record['cpu_s']:.2f}s CPU, "
+              f"peak RSS {record['peak_rss_mb']:.0f}MB, traced peak {record['traced_peak_mb']:.1f}MB")
+    slowest = max((r for r in records if r['stage'].count(';') > 1), key=lambda r: r['wall_s'], default=None)
+    if slowest:
+        print(f"🐢 Slowest sub-stage: {slowest['stage']} ({slowest['wall_s']:.2f}s)")
+    print(f"💾 Saved {REPORT_FILE} and {FOLDED_FILE} (flamegraph folded stacks)")
+
+    return success
+
+if __name__ == "__main__":
+    success = main()
+    exit(0 if success else 1)
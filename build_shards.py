@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Split dashboard_data.json into one columnar shard per section plus an index
+
+The page fetches the index first, then a section's shard only when the tab
+that shows it is opened. Shards carry precomputed sort indexes for their
+numeric columns, so header sorts need no comparisons in the browser. Small
+object sections (spyBenchmark) are inlined in the index so the first table
+needs nothing beyond its own shard.
+
+Every artifact name carries a hash of its content (e.g.
+individualData.3f9a1c0b2d4e.dcol), and index.html is rewritten to point at the
+current index. Unchanged files keep their URL and can be cached forever;
+changed data gets a new URL and is picked up on the next page load.
+"""
+
+import hashlib
+import json
+import os
+import re
+
+from dashboard_io import iter_sections
+from export_columnar import encode_sections
+
+SHARD_DIR = 'data'
+HTML_FILE = 'index.html'
+HASH_LENGTH = 12
+
+def content_hash(payload):
+    return hashlib.sha256(payload).hexdigest()[:HASH_LENGTH]
+
+def file_hash(path):
+    with open(path, 'rb') as f:
+        return content_hash(f.read())
+
+def _write_hashed(directory, stem, extension, payload):
+    """Write payload as <stem>.<hash>.<extension>; returns the file name"""
+    filename = f"{stem}.{content_hash(payload)}.{extension}"
+    path = os.path.join(directory, filename)
+    if not os.path.exists(path):
+        with open(path, 'wb') as f:
+            f.write(payload)
+    return filename
+
+def write_shards(path='dashboard_data.json', shard_dir=SHARD_DIR):
+    """Write one content-hashed .dcol shard per list section and the index manifest.
+
+    Returns (index, index file name).
+    """
+    os.makedirs(shard_dir, exist_ok=True)
+    index = {"version": 1, "sections": {}, "objects": {}}
+
+    for name, value in iter_sections(path):
+        if isinstance(value, dict):
+            index['objects'][name] = value
+            continue
+        records = list(value)
+        payload = encode_sections([(name, records)], sort_indexes=True)
+        shard_file = _write_hashed(shard_dir, name, 'dcol', payload)
+        index['sections'][name] = {"file": f"{shard_dir}/{shard_file}", "rows": len(records), "bytes": len(payload)}
+
+    index_payload = json.dumps(index, separators=(',', ':')).encode('utf-8')
+    index_file = _write_hashed(shard_dir, 'index', 'json', index_payload)
+
+    # Remove artifacts from previous builds
+    current = {os.path.basename(entry['file']) for entry in index['sections'].values()} | {index_file}
+    for filename in os.listdir(shard_dir):
+        if (filename.endswith('.dcol') or filename.startswith('index.')) and filename not in current:
+            os.remove(os.path.join(shard_dir, filename))
+
+    return index, index_file
+
+def update_html_references(html_path, index_url, data_url):
+    """Point index.html at the current hashed index and versioned full data file"""
+    with open(html_path, 'r') as f:
+        content = f.read()
+
+    updated = re.sub(r"const DATA_INDEX_URL = '[^']*';", f"const DATA_INDEX_URL = '{index_url}';", content)
+    updated = re.sub(r"const FULL_DATA_URL = '[^']*';", f"const FULL_DATA_URL = '{data_url}';", updated)
+
+    if updated != content:
+        with open(html_path, 'w') as f:
+            f.write(updated)
+    return updated != content
+
+def main():
+    print("🔧 Writing per-section data shards...")
+
+    index, index_file = write_shards('dashboard_data.json')
+
+    for name, entry in index['sections'].items():
+        print(f"  - {entry['file']}: {entry['rows']} strategies, {entry['bytes']/1024:.1f}KB")
+    print(f"💾 Saved {len(index['sections'])} shards and {SHARD_DIR}/{index_file}")
+
+    # The full JSON file keeps its name (it is the pipeline's source of truth), so version it by query string
+    data_url = f"dashboard_data.json?v={file_hash('dashboard_data.json')}"
+    if update_html_references(HTML_FILE, f"{SHARD_DIR}/{index_file}", data_url):
+        print(f"🔗 Updated {HTML_FILE} data references")
+
+    return True
+
+if __name__ == "__main__":
+    success = main()
+    exit(0 if success else 1)
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Search k-of-n combinations of individual signals for combinationData
+
+A combination holds equal weights of its member strategies' daily returns (the
+strategy returns saved by backtest.py). Its mean and variance follow exactly
+from the members' means and covariance matrix, so candidates are scored
+without touching the daily returns:
+
+- signals are ordered by mean return and combinations are grown depth-first
+  with increasing indices;
+- a member may not share its indicator with another member or correlate above
+  MAX_CORRELATION with one;
+- a partial combination is pruned (branch and bound) when an upper bound on
+  the Sharpe ratio of any completion cannot beat the worst of the TOP_K kept;
+  the bound pairs the best possible mean with the smallest possible variance
+  when that mean is positive, and with the largest when it is not;
+- the last member is chosen for all remaining candidates in one vectorized
+  step.
+
+Root branches are split across a process pool, each task keeping its own
+bounded top-K heap; merging the heaps gives the same result for any number of
+workers. The winners' returns are then combined and scored with the full
+metric kernel and written to combinationData.
+
+Run after backtest.py, and before create_complete_data.py (which derives
+technicalCombinationData from combinationData).
+"""
+
+import heapq
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import backtest
+from dashboard_io import read_sections
+from metrics import DAY_CHUNK, PERIODS_PER_YEAR, batch_metrics
+from strategy_table import StrategyTable
+
+COMBINATION_SIZES = (3, 4)
+TOP_K = 60
+MAX_CORRELATION = 0.7
+ROOTS_PER_TASK = 4
+MAX_WORKERS = None  # None = one worker process per CPU
+
+# Search inputs, set in each worker process by _init_worker()
+_search = {}
+
+def return_moments(returns, rows):
+    """Means and covariance (ddof=1) of the given rows, accumulated over day blocks"""
+    rows = np.asarray(rows)
+    days = returns.shape[1]
+    sums = np.zeros(len(rows))
+    products = np.zeros((len(rows), len(rows)))
+    for start in range(0, days, DAY_CHUNK):
+        block = np.asarray(returns[rows, start:start + DAY_CHUNK], dtype=np.float64)
+        sums += block.sum(axis=1)
+        products += block @ block.T
+    means = sums / days
+    covariance = (products - days * np.outer(means, means)) / (days - 1)
+    return means, covariance
+
+def _init_worker(means, covariance, indicators, sizes, top_k, max_correlation):
+    std = np.sqrt(np.diag(covariance))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        correlation = covariance / np.outer(std, std)
+    diagonal = np.diag(np.full(len(means), np.inf))
+    _search.update(
+        means=means,
+        covariance=covariance,
+        # Pairs a combination may not contain: same indicator or too correlated
+        conflicts=(indicators[:, None] == indicators[None, :]) | (np.nan_to_num(correlation) > max_correlation),
+        min_covariance=(covariance + diagonal).min(axis=1),
+        max_covariance=(covariance - diagonal).max(axis=1),
+        sizes=sizes,
+        top_k=top_k,
+    )
+
+def _push(heap, top_k, entries):
+    """Keep the top_k (sharpe, combination) entries; ties are broken by the combination"""
+    for entry in entries:
+        if len(heap) < top_k:
+            heapq.heappush(heap, entry)
+        elif entry > heap[0]:
+            heapq.heapreplace(heap, entry)
+
+def _extend(heap, chosen, allowed, size, mean_sum, pair_cov, cross, stats):
+    """Grow one partial combination.
+
+    chosen: member indices so far; allowed: mask of candidates that may still
+    be added; mean_sum: sum of chosen means; pair_cov: sum of covariance over
+    all ordered pairs of chosen members; cross: each candidate's covariance
+    summed over the chosen members.
+    """
+    means, covariance = _search['means'], _search['covariance']
+    top_k = _search['top_k']
+    candidates = np.flatnonzero(allowed)
+    remaining = size - len(chosen)
+    if len(candidates) < remaining:
+        return
+    threshold = heap[0][0] if len(heap) == top_k else -np.inf
+
+    if remaining == 1:
+        # Exact Sharpe for every completion at once
+        variance = pair_cov + 2 * cross[candidates] + covariance[candidates, candidates]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            sharpe = (mean_sum + means[candidates]) / np.sqrt(variance) * np.sqrt(PERIODS_PER_YEAR)
+        stats['evaluated'] += len(candidates)
+        keep = sharpe >= threshold  # ties are settled by the combination in _push
+        _push(heap, top_k, [(value, chosen + (j,)) for value, j in zip(sharpe[keep].tolist(), candidates[keep].tolist())])
+        return
+
+    # Upper bound on the Sharpe ratio of any completion. Candidates are in descending mean order,
+    # so the best means come first. Each candidate adds its variance, its covariance with the chosen
+    # members and its covariance with each other newcomer, which lies between its smallest and
+    # largest covariance with anyone. A positive mean is best over the smallest possible variance,
+    # a negative one over the largest.
+    best_mean = mean_sum + means[candidates[:remaining]].sum()
+    own = covariance[candidates, candidates] + 2 * cross[candidates]
+    if best_mean > 0:
+        added = own + (remaining - 1) * _search['min_covariance'][candidates]
+        variance = pair_cov + np.partition(added, remaining - 1)[:remaining].sum()
+    else:
+        added = own + (remaining - 1) * _search['max_covariance'][candidates]
+        variance = pair_cov + np.partition(added, len(added) - remaining)[-remaining:].sum()
+    if threshold > -np.inf and variance > 0 and best_mean / np.sqrt(variance) * np.sqrt(PERIODS_PER_YEAR) < threshold:
+        stats['pruned'] += 1
+        return
+
+    conflicts = _search['conflicts']
+    for j in candidates[:len(candidates) - remaining + 1].tolist():
+        later = allowed.copy()
+        later[:j + 1] = False
+        later &= ~conflicts[j]
+        _extend(heap, chosen + (j,), later, size, mean_sum + means[j],
+                pair_cov + 2 * cross[j] + covariance[j, j], cross + covariance[j], stats)
+        if len(heap) == top_k:
+            threshold = heap[0][0]
+
+def search_roots(roots):
+    """Top-K combinations whose first (highest mean) member is one of roots"""
+    means, covariance, conflicts = _search['means'], _search['covariance'], _search['conflicts']
+    heap = []
+    stats = {'evaluated': 0, 'pruned': 0}
+    for size in _search['sizes']:
+        for root in roots:
+            allowed = ~conflicts[root]
+            allowed[:root + 1] = False
+            _extend(heap, (root,), allowed, size, means[root], covariance[root, root], covariance[root].copy(), stats)
+    return heap, stats
+
+def search(means, covariance, indicators, sizes=COMBINATION_SIZES, top_k=TOP_K,
+           max_correlation=MAX_CORRELATION, max_workers=MAX_WORKERS):
+    """Best combinations by Sharpe ratio; returns ([(sharpe, member indices)], stats).
+
+    Indices refer to the rows of means/covariance, which must be sorted by
+    descending mean.
+    """
+    n = len(means)
+    tasks = [range(start, min(start + ROOTS_PER_TASK, n)) for start in range(0, n, ROOTS_PER_TASK)]
+    init_args = (means, covariance, np.asarray(indicators, dtype=object), tuple(sizes), top_k, max_correlation)
+
+    heap = []
+    stats = {'evaluated': 0, 'pruned': 0}
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=init_args) as pool:
+        for task_heap, task_stats in pool.map(search_roots, tasks):
+            _push(heap, top_k, task_heap)
+            for name in stats:
+                stats[name] += task_stats[name]
+    return sorted(heap, reverse=True), stats
+
+def combination_name(indicators, transforms):
+    label = transforms[0].replace('_', ' ').title() if len(set(transforms)) == 1 else "Blend"
+    return f"{' / '.join(indicators)} {label}"
+
+def combination_table(combos, signals, returns):
+    """combinationData rows for the given member combinations, scored on their combined returns"""
+    portfolios = np.vstack([np.asarray(returns[np.sort(signals['row'][list(combo)])]).mean(axis=0)
+                            for combo in combos]) if combos else np.empty((0, returns.shape[1]))
+    indicators = signals['indicator']
+    transforms = signals['transform_type']
+    total_trades = np.array([signals['total_trades'][list(combo)].sum() for combo in combos], dtype=np.int64)
+    return StrategyTable({
+        "strategy_name": [combination_name([indicators[i] for i in combo], [transforms[i] for i in combo]) for combo in combos],
+        "indicators_used": [" + ".join(f"{indicators[i]}→{transforms[i]}" for i in combo) for combo in combos],
+        **batch_metrics(portfolios),
+        "win_rate": (portfolios > 0).sum(axis=1) / np.maximum((portfolios != 0).sum(axis=1), 1),
+        "total_trades": total_trades,
+        "avg_trades_per_year": total_trades / (returns.shape[1] / PERIODS_PER_YEAR),
+    })
+
+def main():
+    print("🔧 Searching signal combinations for combinationData...")
+
+    saved = backtest.load_strategy_returns()
+    if saved is None:
+        print(f"❌ No strategy returns in {backtest.MARKET_DATA_DIR}/; run backtest.py first")
+        return False
+    rows, returns = saved
+
+    # Candidate signals: individualData strategies with backtested returns, by descending mean return
+    base = StrategyTable.from_records(read_sections('dashboard_data.json', ['individualData'])['individualData'])
+    keys = list(zip(base['indicator'].tolist(), base['transform_type'].tolist()))
+    base = base.take(np.array([i for i, key in enumerate(keys) if key in rows], dtype=np.int64))
+    base['row'] = np.array([rows[key] for key in zip(base['indicator'].tolist(), base['transform_type'].tolist())], dtype=np.int64)
+    means, covariance = return_moments(returns, base['row'])
+    order = np.argsort(-means, kind='stable')
+    signals = base.take(order)
+    means, covariance = means[order], covariance[np.ix_(order, order)]
+    print(f"📈 {len(signals)} signals, combinations of {' or '.join(map(str, COMBINATION_SIZES))}, "
+          f"max correlation {MAX_CORRELATION}")
+
+    start = time.time()
+    best, stats = search(means, covariance, signals['indicator'])
+    print(f"⚙️  Scored {stats['evaluated']:,} combinations and pruned {stats['pruned']:,} branches "
+          f"in {time.time() - start:.1f}s ({MAX_WORKERS or os.cpu_count()} worker processes)")
+
+    table = combination_table([combo for _, combo in best], signals, returns)
+    written = backtest.replace_section('dashboard_data.json', 'combinationData', table)
+    print(f"💾 Saved top {written} combinations to combinationData")
+    if written:
+        top = next(iter(table.head(1)))
+        print(f"🏆 Best: {top['indicators_used']} (Sharpe {top['sharpe_ratio']:.2f})")
+
+    return True
+
+if __name__ == "__main__":
+    success = main()
+    exit(0 if success else 1)
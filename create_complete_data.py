@@ -1,168 +1,349 @@
 #!/usr/bin/env python3
 """
 Create complete dashboard data with clustering and ML analysis data
+
+Derived sections are rebuilt only when their inputs change: DERIVED_SECTIONS
+declares which source sections each generator reads, and the fingerprints in
+the build cache decide whether a section is regenerated or copied unchanged
+from the previous run.
+
+Stale sections are generated in a process pool. Each section draws from its own
+random stream (seeding.py), derived from the build seed and the section name, so
+the output is the same whatever the number of workers or the order in which
+sections finish.
+
+When market_data/ holds prices and the strategy returns saved by backtest.py,
+the benchmark, clustering and technical individual sections are computed from
+backtested returns rather than perturbed from individualData. The directory's
+contents are a build input like any section, so changing them rebuilds exactly
+the sections that read them.
 """
 
-import json
-import random
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+
+import backtest
+from build_cache import BuildCache, data_fingerprint, recipe_fingerprint
+import build_profile
+from dashboard_io import DashboardWriter, dump_value, read_sections
+from metrics import batch_metrics
+from seeding import numpy_rng, stream_seed
+from strategy_table import StrategyTable, uniform_columns
+
+SOURCE_SECTIONS = ['individualData', 'combinationData']
+# Pseudo-section naming the market data directory (None when there is no backtest data)
+MARKET_DATA = 'marketData'
+MAX_WORKERS = None  # None = one worker process per CPU
+
+def _portfolio_clustering_data(base_data, method_name, num_strategies, rng, market_data):
+    """Equal-weight portfolios of top backtested strategies, measured on their real daily returns.
+
+    None when there are no saved strategy returns or no individualData row has any.
+    """
+    loaded = backtest.load_strategy_returns(market_data)
+    if loaded is None:
+        return None
+    rows, returns = loaded
+    base = StrategyTable.from_records(base_data)
+    keys = list(zip(base['indicator'].tolist(), base['transform_type'].tolist()))
+    base = base.take(np.array([i for i, key in enumerate(keys) if key in rows], dtype=np.int64))
+    top = base.take(base.argsort('sharpe_ratio', descending=True)[:50])
+    n = min(num_strategies, len(top))
+    if n == 0:
+        return None
+    top_keys = list(zip(top['indicator'].tolist(), top['transform_type'].tolist()))
+    top_rows = np.array([rows[key] for key in top_keys])
+    top_positions = backtest.strategy_positions(top_keys, market_data)
+    
+    features = rng.choice([2, 3, 4, 5], n)
+    members = [np.sort(rng.choice(len(top), min(size, len(top)), replace=False)) for size in features]
+    portfolios = np.vstack([returns[top_rows[m]].mean(axis=0) for m in members])
+    # A trade runs while any member holds a position, as in backtest.trade_stats
+    positions = np.vstack([top_positions[m].mean(axis=0) for m in members])
+    total_trades, win_rate = backtest.trade_stats(positions, portfolios)
+    
+    return StrategyTable({
+        "strategy_name": [f"Cluster {i+1} - {method_name.title()}" for i in range(n)],
+        "algorithm": np.full(n, method_name.upper(), dtype=object),
+        "features": features,
+        **batch_metrics(portfolios),
+        "win_rate": win_rate,
+        "total_trades": total_trades
+    })
 
-def create_clustering_data(base_data, method_name, num_strategies=15):
+def create_clustering_data(base_data, method_name, num_strategies=15, rng=None, market_data=None):
     """Create clustering strategies based on existing individual data"""
-    clustering_data = []
+    rng = rng or numpy_rng('create_clustering_data')
+    
+    if market_data is not None:
+        clustering_data = _portfolio_clustering_data(base_data, method_name, num_strategies, rng, market_data)
+        if clustering_data is not None:
+            return clustering_data
+    
+    base = StrategyTable.from_records(base_data).head(50)
     
     # Select top performing strategies as base
-    top_strategies = sorted(base_data[:50], key=lambda x: x['sharpe_ratio'], reverse=True)[:num_strategies]
-    
-    for i, strategy in enumerate(top_strategies):
-        # Create clustering variant with modified performance
-        cluster_strategy = {
-            "strategy_name": f"Cluster {i+1} - {method_name.title()}",
-            "algorithm": method_name.upper(),
-            "features": random.choice([2, 3, 4, 5]),
-            "terminal_value": strategy['terminal_value'] * random.uniform(0.8, 1.3),
-            "annual_return": strategy['annual_return'] * random.uniform(0.85, 1.2),
-            "volatility": strategy['volatility'] * random.uniform(0.9, 1.1),
-            "max_drawdown": abs(strategy['max_drawdown']) * random.uniform(0.7, 1.2),
-            "sharpe_ratio": strategy['sharpe_ratio'] * random.uniform(0.8, 1.15),
-            "sortino_ratio": strategy.get('sortino_ratio', strategy['sharpe_ratio'] * 1.2) * random.uniform(0.85, 1.1),
-            "calmar_ratio": strategy.get('calmar_ratio', strategy['sharpe_ratio'] * 0.8) * random.uniform(0.8, 1.1),
-            "win_rate": strategy['win_rate'] * random.uniform(0.9, 1.1),
-            "total_trades": int(strategy['total_trades'] * random.uniform(0.8, 1.2))
-        }
-        clustering_data.append(cluster_strategy)
+    top = base.take(base.argsort('sharpe_ratio', descending=True)[:num_strategies])
+    n = len(top)
+    sharpe = top['sharpe_ratio']
+    
+    # Create clustering variants with modified performance
+    clustering_data = StrategyTable({
+        "strategy_name": [f"Cluster {i+1} - {method_name.title()}" for i in range(n)],
+        "algorithm": np.full(n, method_name.upper(), dtype=object),
+        "features": rng.choice([2, 3, 4, 5], n),
+        **top.perturb({
+            "terminal_value": (0.8, 1.3),
+            "annual_return": (0.85, 1.2),
+            "volatility": (0.9, 1.1),
+        }, rng),
+        "max_drawdown": -np.abs(top['max_drawdown']) * rng.uniform(0.7, 1.2, n),
+        "sharpe_ratio": sharpe * rng.uniform(0.8, 1.15, n),
+        "sortino_ratio": top.get('sortino_ratio', sharpe * 1.2) * rng.uniform(0.85, 1.1, n),
+        "calmar_ratio": top.get('calmar_ratio', sharpe * 0.8) * rng.uniform(0.8, 1.1, n),
+        "win_rate": top['win_rate'] * rng.uniform(0.9, 1.1, n),
+        "total_trades": (top['total_trades'] * rng.uniform(0.8, 1.2, n)).astype(np.int64)
+    })
     
     return clustering_data
 
-def create_spy_ml_data(num_strategies=12):
+def create_spy_ml_data(num_strategies=12, rng=None):
     """Create SPY ML analysis data"""
+    rng = rng or numpy_rng('create_spy_ml_data')
     algorithms = ["Random Forest", "XGBoost", "Neural Network", "SVM", "Linear Regression", 
                   "Decision Tree", "Gradient Boosting", "AdaBoost", "KNN", "Naive Bayes",
                   "Ridge Regression", "Lasso Regression"]
     
-    ml_data = []
-    for i, algo in enumerate(algorithms[:num_strategies]):
-        strategy = {
-            "strategy_name": f"SPY {algo} Model",
-            "algorithm": algo,
-            "features": random.choice([5, 8, 12, 15, 20]),
-            "terminal_value": random.uniform(25000, 55000),
-            "annual_return": random.uniform(0.06, 0.14),
-            "volatility": random.uniform(0.08, 0.16),
-            "max_drawdown": random.uniform(0.10, 0.25),
-            "sharpe_ratio": random.uniform(0.4, 1.0),
-            "sortino_ratio": random.uniform(0.5, 1.2),
-            "calmar_ratio": random.uniform(0.25, 0.8),
-            "win_rate": random.uniform(0.45, 0.65),
-            "total_trades": random.randint(150, 300)
-        }
-        ml_data.append(strategy)
+    selected = algorithms[:num_strategies]
+    n = len(selected)
+    ml_data = StrategyTable({
+        "strategy_name": [f"SPY {algo} Model" for algo in selected],
+        "algorithm": selected,
+        "features": rng.choice([5, 8, 12, 15, 20], n),
+        **uniform_columns({
+            "terminal_value": (25000, 55000),
+            "annual_return": (0.06, 0.14),
+            "volatility": (0.08, 0.16),
+            "max_drawdown": (-0.25, -0.10),
+            "sharpe_ratio": (0.4, 1.0),
+            "sortino_ratio": (0.5, 1.2),
+            "calmar_ratio": (0.25, 0.8),
+            "win_rate": (0.45, 0.65),
+        }, n, rng),
+        "total_trades": rng.integers(150, 300, n, endpoint=True)
+    })
     
     return ml_data
 
-def create_spy_clustering_data(num_strategies=10):
+def create_spy_clustering_data(num_strategies=10, rng=None):
     """Create SPY clustering analysis data"""
-    spy_clustering = []
+    rng = rng or numpy_rng('create_spy_clustering_data')
     clusters = ["High Vol Cluster", "Low Vol Cluster", "Trend Cluster", "Mean Reversion Cluster",
                 "Momentum Cluster", "Contrarian Cluster", "Breakout Cluster", "Range Bound Cluster",
                 "Bull Market Cluster", "Bear Market Cluster"]
     
-    for i, cluster_name in enumerate(clusters[:num_strategies]):
-        strategy = {
-            "strategy_name": f"SPY {cluster_name}",
-            "algorithm": "K-Means",
-            "features": random.choice([3, 4, 5, 6]),
-            "cluster": i + 1,
-            "terminal_value": random.uniform(20000, 50000),
-            "annual_return": random.uniform(0.04, 0.12),
-            "volatility": random.uniform(0.07, 0.18),
-            "max_drawdown": random.uniform(0.08, 0.30),
-            "sharpe_ratio": random.uniform(0.3, 0.9),
-            "sortino_ratio": random.uniform(0.4, 1.0),
-            "calmar_ratio": random.uniform(0.2, 0.7),
-            "win_rate": random.uniform(0.40, 0.70),
-            "total_trades": random.randint(100, 250)
-        }
-        spy_clustering.append(strategy)
+    selected = clusters[:num_strategies]
+    n = len(selected)
+    spy_clustering = StrategyTable({
+        "strategy_name": [f"SPY {cluster_name}" for cluster_name in selected],
+        "algorithm": np.full(n, "K-Means", dtype=object),
+        "features": rng.choice([3, 4, 5, 6], n),
+        "cluster": np.arange(1, n + 1),
+        **uniform_columns({
+            "terminal_value": (20000, 50000),
+            "annual_return": (0.04, 0.12),
+            "volatility": (0.07, 0.18),
+            "max_drawdown": (-0.30, -0.08),
+            "sharpe_ratio": (0.3, 0.9),
+            "sortino_ratio": (0.4, 1.0),
+            "calmar_ratio": (0.2, 0.7),
+            "win_rate": (0.40, 0.70),
+        }, n, rng),
+        "total_trades": rng.integers(100, 250, n, endpoint=True)
+    })
     
     return spy_clustering
 
-def create_orthogonal_data(data_type, num_strategies=8):
+def create_orthogonal_data(data_type, num_strategies=8, rng=None):
     """Create orthogonal analysis data"""
-    orthogonal_data = []
+    rng = rng or numpy_rng('create_orthogonal_data')
     factor_names = ["Factor 1", "Factor 2", "Factor 3", "Factor 4", "Factor 5", 
                    "Factor 6", "Factor 7", "Factor 8"]
     
-    for i, factor in enumerate(factor_names[:num_strategies]):
-        strategy = {
-            "strategy_name": f"{data_type} {factor}",
-            "factor": factor,
-            "loading": random.uniform(-0.8, 0.8),
-            "terminal_value": random.uniform(18000, 45000),
-            "annual_return": random.uniform(0.03, 0.11),
-            "volatility": random.uniform(0.06, 0.15),
-            "max_drawdown": random.uniform(0.05, 0.28),
-            "sharpe_ratio": random.uniform(0.2, 0.85),
-            "sortino_ratio": random.uniform(0.3, 1.0),
-            "calmar_ratio": random.uniform(0.15, 0.65),
-            "win_rate": random.uniform(0.35, 0.65),
-            "total_trades": random.randint(80, 220)
-        }
-        orthogonal_data.append(strategy)
+    selected = factor_names[:num_strategies]
+    n = len(selected)
+    orthogonal_data = StrategyTable({
+        "strategy_name": [f"{data_type} {factor}" for factor in selected],
+        "factor": selected,
+        "loading": rng.uniform(-0.8, 0.8, n),
+        **uniform_columns({
+            "terminal_value": (18000, 45000),
+            "annual_return": (0.03, 0.11),
+            "volatility": (0.06, 0.15),
+            "max_drawdown": (-0.28, -0.05),
+            "sharpe_ratio": (0.2, 0.85),
+            "sortino_ratio": (0.3, 1.0),
+            "calmar_ratio": (0.15, 0.65),
+            "win_rate": (0.35, 0.65),
+        }, n, rng),
+        "total_trades": rng.integers(80, 220, n, endpoint=True)
+    })
     
     return orthogonal_data
 
-def create_technical_data(data_type, base_data, num_strategies=20):
-    """Create technical analysis data"""
-    technical_data = []
+def create_technical_data(data_type, base_data, num_strategies=20, rng=None, market_data=None):
+    """Create technical analysis data.
+    
+    Base strategies are reused cyclically when num_strategies exceeds the base
+    data, so arbitrarily large tables can be generated for load testing.
+    With market data, individual strategies are instead the best of a backtest
+    of price-derived indicators (RSI, moving average gaps, ...) x transforms.
+    """
+    rng = rng or numpy_rng('create_technical_data')
+    
+    if market_data is not None and data_type == "individual":
+        _, prices, _, _ = backtest.load_market_data(market_data)
+        names, indicators = backtest.technical_indicators(prices)
+        grid = backtest.run_grid([f"SPY {name}" for name in names], indicators, prices)
+        return grid.take(grid.argsort('sharpe_ratio', descending=True)[:num_strategies])
+    
+    base = StrategyTable.from_records(base_data)
     
     # Use some existing strategies as base
-    selected = base_data[:num_strategies]
-    
-    for i, strategy in enumerate(selected):
-        if data_type == "individual":
-            tech_strategy = {
-                "indicator": f"SPY {strategy['indicator']}",
-                "transform_type": strategy['transform_type'],
-                "terminal_value": strategy['terminal_value'] * random.uniform(0.7, 1.1),
-                "annual_return": strategy['annual_return'] * random.uniform(0.8, 1.1),
-                "volatility": strategy['volatility'] * random.uniform(0.9, 1.2),
-                "max_drawdown": abs(strategy['max_drawdown']) * random.uniform(0.8, 1.3),
-                "sharpe_ratio": strategy['sharpe_ratio'] * random.uniform(0.7, 1.0),
-                "sortino_ratio": strategy.get('sortino_ratio', strategy['sharpe_ratio'] * 1.1) * random.uniform(0.8, 1.0),
-                "calmar_ratio": strategy.get('calmar_ratio', strategy['sharpe_ratio'] * 0.7) * random.uniform(0.7, 1.0),
-                "win_rate": strategy['win_rate'] * random.uniform(0.85, 1.15),
-                "total_trades": int(strategy['total_trades'] * random.uniform(0.7, 1.3)),
-                "avg_trades_per_year": strategy.get('avg_trades_per_year', strategy['total_trades'] / 15) * random.uniform(0.7, 1.3)
-            }
-        else:
-            # For combination data, use strategy_name instead of indicator
-            tech_strategy = {
-                "strategy_name": f"SPY {strategy['strategy_name']}",
-                "indicators_used": f"SPY-based {strategy['indicators_used'][:50]}...",
-                "terminal_value": strategy['terminal_value'] * random.uniform(0.7, 1.1),
-                "annual_return": strategy['annual_return'] * random.uniform(0.8, 1.1),
-                "volatility": strategy['volatility'] * random.uniform(0.9, 1.2),
-                "max_drawdown": abs(strategy['max_drawdown']) * random.uniform(0.8, 1.3),
-                "sharpe_ratio": strategy['sharpe_ratio'] * random.uniform(0.7, 1.0),
-                "sortino_ratio": strategy.get('sortino_ratio', strategy['sharpe_ratio'] * 1.1) * random.uniform(0.8, 1.0),
-                "calmar_ratio": strategy.get('calmar_ratio', strategy['sharpe_ratio'] * 0.7) * random.uniform(0.7, 1.0),
-                "win_rate": strategy['win_rate'] * random.uniform(0.85, 1.15),
-                "total_trades": int(strategy['total_trades'] * random.uniform(0.7, 1.3)),
-                "avg_trades_per_year": strategy.get('avg_trades_per_year', strategy['total_trades'] / 15) * random.uniform(0.7, 1.3)
-            }
-        technical_data.append(tech_strategy)
+    selected = base.cycle(num_strategies)
+    n = len(selected)
+    sharpe = selected['sharpe_ratio']
+    total_trades = selected['total_trades']
+    
+    if data_type == "individual":
+        labels = {
+            "indicator": np.char.add("SPY ", selected['indicator'].astype(str)).astype(object),
+            "transform_type": selected['transform_type'],
+        }
+    else:
+        # For combination data, use strategy_name instead of indicator
+        labels = {
+            "strategy_name": np.char.add("SPY ", selected['strategy_name'].astype(str)).astype(object),
+            "indicators_used": [f"SPY-based {used[:50]}..." for used in selected['indicators_used']],
+        }
+    
+    technical_data = StrategyTable({
+        **labels,
+        **selected.perturb({
+            "terminal_value": (0.7, 1.1),
+            "annual_return": (0.8, 1.1),
+            "volatility": (0.9, 1.2),
+        }, rng),
+        "max_drawdown": -np.abs(selected['max_drawdown']) * rng.uniform(0.8, 1.3, n),
+        "sharpe_ratio": sharpe * rng.uniform(0.7, 1.0, n),
+        "sortino_ratio": selected.get('sortino_ratio', sharpe * 1.1) * rng.uniform(0.8, 1.0, n),
+        "calmar_ratio": selected.get('calmar_ratio', sharpe * 0.7) * rng.uniform(0.7, 1.0, n),
+        "win_rate": selected['win_rate'] * rng.uniform(0.85, 1.15, n),
+        "total_trades": (total_trades * rng.uniform(0.7, 1.3, n)).astype(np.int64),
+        "avg_trades_per_year": selected.get('avg_trades_per_year', total_trades / 15) * rng.uniform(0.7, 1.3, n)
+    })
     
     return technical_data
 
+def section(build, inputs=None, **params):
+    """Declare a derived section: build(**{arg: input section}, **params)"""
+    return {"build": build, "inputs": inputs or {}, "params": params}
+
+DERIVED_SECTIONS = {
+    "macroClusteringKmeansData": section(create_clustering_data, {"base_data": "individualData", "market_data": MARKET_DATA}, method_name="kmeans", num_strategies=12),
+    "macroClusteringHierarchicalData": section(create_clustering_data, {"base_data": "individualData", "market_data": MARKET_DATA}, method_name="hierarchical", num_strategies=10),
+    "macroClusteringPcaData": section(create_clustering_data, {"base_data": "individualData", "market_data": MARKET_DATA}, method_name="pca", num_strategies=8),
+    "macroClusteringDbscanData": section(create_clustering_data, {"base_data": "individualData", "market_data": MARKET_DATA}, method_name="dbscan", num_strategies=6),
+    "macroClusteringGaussianData": section(create_clustering_data, {"base_data": "individualData", "market_data": MARKET_DATA}, method_name="gaussian", num_strategies=7),
+    "macroClusteringSpectralData": section(create_clustering_data, {"base_data": "individualData", "market_data": MARKET_DATA}, method_name="spectral", num_strategies=9),
+    "spyMLData": section(create_spy_ml_data, num_strategies=12),
+    "technicalIndividualData": section(create_technical_data, {"base_data": "individualData", "market_data": MARKET_DATA}, data_type="individual", num_strategies=25),
+    # cycle(15) only reads the first 15 combinations
+    "technicalCombinationData": section(create_technical_data, {"base_data": "combinationData"}, data_type="combination", num_strategies=15),
+    "spyClusteringData": section(create_spy_clustering_data, num_strategies=10),
+    "macroOrthogonalData": section(create_orthogonal_data, data_type="Macro", num_strategies=8),
+    "spyOrthogonalData": section(create_orthogonal_data, data_type="SPY", num_strategies=6),
+    "combinedOrthogonalData": section(create_orthogonal_data, data_type="Combined", num_strategies=10)
+}
+
+def build_section(name, inputs, cache_path, profile=False):
+    """Generate one derived section into its cache file; returns its record count.
+
+    Runs in a worker process. The file is written under a temporary name and
+    moved into place, so an interrupted build never leaves a partial entry.
+    With profile=True, returns (count, build_profile stage records) instead.
+    """
+    if profile:
+        build_profile.enable()
+    try:
+        with build_profile.stage(name):
+            spec = DERIVED_SECTIONS[name]
+            rng = numpy_rng(name)
+            with build_profile.stage('build'):
+                table = spec['build'](**inputs, **spec['params'], rng=rng)
+
+            with build_profile.stage('dump'):
+                tmp_path = f"{cache_path}.tmp"
+                with open(tmp_path, 'w') as f:
+                    count = dump_value(table, f.write)
+                os.replace(tmp_path, cache_path)
+    finally:
+        records = build_profile.disable() if profile else None
+    return (count, records) if profile else count
+
+def generate_sections(names, values, cache, max_workers=MAX_WORKERS):
+    """Build the named derived sections in a process pool; returns {name: record count}.
+
+    A section is submitted once none of its inputs is still waiting to be
+    built, so sections that read other derived sections run after them.
+    """
+    os.makedirs(cache.cache_dir, exist_ok=True)
+    pending = list(names)
+    counts = {}
+    running = {}
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        while pending or running:
+            for name in list(pending):
+                sources = DERIVED_SECTIONS[name]['inputs'].values()
+                if any(source in pending or source in running.values() for source in sources):
+                    continue
+                inputs = {}
+                for arg, source in DERIVED_SECTIONS[name]['inputs'].items():
+                    if source not in values:
+                        values[source] = cache.load(source)
+                    inputs[arg] = values[source]
+                running[pool.submit(build_section, name, inputs, cache.path(name), build_profile.enabled())] = name
+                pending.remove(name)
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                if build_profile.enabled():
+                    result, records = result
+                    build_profile.add_records(records)
+                counts[running.pop(future)] = result
+
+    return counts
+
 def main():
     print("🔧 Creating complete dashboard data with all missing sections...")
     
-    # Read existing data
-    with open('dashboard_data.json', 'r') as f:
-        existing_data = json.load(f)
+    # Read only the source sections; everything else is regenerated or reused
+    with build_profile.stage('load'):
+        values = read_sections('dashboard_data.json', SOURCE_SECTIONS)
+    with build_profile.stage('fingerprint'):
+        fingerprints = {name: data_fingerprint(values[name]) for name in SOURCE_SECTIONS}
+    cache = BuildCache()
     
-    individual_data = existing_data['individualData']
-    combination_data = existing_data['combinationData']
+    # Backtest output, if any, is an input of the sections that can use it
+    with build_profile.stage('load_market_data'):
+        market = backtest.load_market_data()
+        has_returns = backtest.load_strategy_returns() is not None
+        values[MARKET_DATA] = backtest.MARKET_DATA_DIR if market is not None and has_returns else None
+        fingerprints[MARKET_DATA] = backtest.market_data_fingerprint() if values[MARKET_DATA] else None
     
     # Create SPY benchmark data
     spy_benchmark = {
@@ -175,40 +356,49 @@ def main():
         "calmar_ratio": 0.5453,
         "win_rate": 0.5234
     }
+    if market is not None:
+        spy_benchmark = backtest.benchmark_metrics(market[1])
     
-    # Create all missing data arrays
-    complete_data = {
-        "individualData": individual_data,
-        "combinationData": combination_data,
-        "spyBenchmark": spy_benchmark,
-        "macroClusteringKmeansData": create_clustering_data(individual_data, "kmeans", 12),
-        "macroClusteringHierarchicalData": create_clustering_data(individual_data, "hierarchical", 10),
-        "macroClusteringPcaData": create_clustering_data(individual_data, "pca", 8),
-        "macroClusteringDbscanData": create_clustering_data(individual_data, "dbscan", 6),
-        "macroClusteringGaussianData": create_clustering_data(individual_data, "gaussian", 7),
-        "macroClusteringSpectralData": create_clustering_data(individual_data, "spectral", 9),
-        "spyMLData": create_spy_ml_data(12),
-        "technicalIndividualData": create_technical_data("individual", individual_data, 25),
-        "technicalCombinationData": create_technical_data("combination", combination_data[:15], 15),
-        "spyClusteringData": create_spy_clustering_data(10),
-        "macroOrthogonalData": create_orthogonal_data("Macro", 8),
-        "spyOrthogonalData": create_orthogonal_data("SPY", 6),
-        "combinedOrthogonalData": create_orthogonal_data("Combined", 10)
-    }
+    # Sections are listed after their inputs, so input fingerprints are always known here
+    stale = []
+    for name, spec in DERIVED_SECTIONS.items():
+        input_fingerprints = {arg: fingerprints[source] for arg, source in spec['inputs'].items()}
+        seed = stream_seed(name)
+        params = dict(spec['params'], seed=[seed.entropy, *seed.spawn_key])
+        fingerprints[name] = recipe_fingerprint(spec['build'], params, input_fingerprints)
+        if not cache.lookup(name, fingerprints[name]):
+            stale.append(name)
+    
+    # Generate stale sections in parallel, straight into the build cache
+    if stale:
+        print(f"⚙️  Generating {len(stale)} sections in {MAX_WORKERS or os.cpu_count()} worker processes...")
+        with build_profile.stage('generate'):
+            for name, count in generate_sections(stale, values, cache).items():
+                cache.record(name, fingerprints[name], count)
+            cache.save()
     
-    # Save complete data
-    with open('dashboard_data.json', 'w') as f:
-        json.dump(complete_data, f, separators=(',', ':'))
+    # Stream the data file in declaration order; derived sections are copied from the cache unchanged
+    counts = {}
+    with build_profile.stage('dump'), DashboardWriter('dashboard_data.json') as writer:
+        for name in SOURCE_SECTIONS:
+            counts[name] = writer.write_section(name, values[name])
+        counts["spyBenchmark"] = writer.write_section("spyBenchmark", spy_benchmark)
+        for name in DERIVED_SECTIONS:
+            with open(cache.path(name), 'r') as f:
+                writer.write_raw_section(name, f)
+            counts[name] = cache.entries[name]['count']
     
     print(f"✅ Complete data saved!")
+    print(f"♻️  Rebuilt {len(stale)} of {len(DERIVED_SECTIONS)} derived sections; reused the rest from the build cache")
     print(f"📊 Data arrays created:")
-    for key, data in complete_data.items():
-        if isinstance(data, list):
-            print(f"  - {key}: {len(data)} strategies")
+    for key, count in counts.items():
+        marker = " (rebuilt)" if key in stale else ""
+        if count is not None:
+            print(f"  - {key}: {count} strategies{marker}")
         else:
             print(f"  - {key}: benchmark data")
     
-    total_strategies = sum(len(data) for data in complete_data.values() if isinstance(data, list))
+    total_strategies = sum(count for count in counts.values() if count is not None)
     print(f"🎯 Total strategies: {total_strategies}")
     
     return True
@@ -4,7 +4,8 @@ Create version that loads data from external JSON to avoid truncation issues
 """
 
 import json
-import re
+
+from js_literals import extract_const_literals
 
 def create_external_data_version():
     print("🔧 Creating external data loading version...")
@@ -36,20 +37,15 @@ def create_external_data_version():
         'combinedOrthogonalData'
     ]
     
+    # One linear pass over the page; literals are parsed without eval
+    literals, errors = extract_const_literals(content, array_patterns)
     for array_name in array_patterns:
-        pattern = rf'const {array_name} = (\[.*?\]);'
-        match = re.search(pattern, content, re.DOTALL)
-        if match:
-            array_str = match.group(1)
-            try:
-                # Convert JavaScript array to Python and back to JSON
-                # This is a simple approach - for production, would use proper JS parser
-                array_str = array_str.replace('true', 'True').replace('false', 'False')
-                array_data = eval(array_str)
-                data_arrays[array_name] = array_data
-                print(f"  ✅ Extracted {array_name}: {len(array_data) if isinstance(array_data, list) else 1} items")
-            except Exception as e:
-                print(f"  ⚠️  Failed to parse {array_name}: {e}")
+        if array_name in literals:
+            array_data = literals[array_name]
+            data_arrays[array_name] = array_data
+            print(f"  ✅ Extracted {array_name}: {len(array_data) if isinstance(array_data, list) else 1} items")
+        elif array_name in errors:
+            print(f"  ⚠️  Failed to parse {array_name}: {errors[array_name]}")
     
     # Save data to external JSON file
     with open('dashboard_data.json', 'w') as f:
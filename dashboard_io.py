@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Streaming reader/writer for dashboard_data.json
+
+The reader walks the top-level object one member at a time and yields list
+sections record by record, so only a single record is held in memory. The
+writer emits sections as they are produced and replaces the target file
+atomically, which lets a script stream from and back to the same path.
+"""
+
+import json
+import os
+import shutil
+
+CHUNK_SIZE = 1 << 16
+WHITESPACE = ' \t\n\r'
+
+class _Stream:
+    """Buffered character stream with incremental JSON value decoding"""
+
+    def __init__(self, f, chunk_size=CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self):
+        if self.eof:
+            return False
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        # Drop consumed text so the buffer never grows past one record + one chunk
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Return the next non-whitespace character without consuming it"""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, chars):
+        ch = self.peek()
+        if ch == '' or ch not in chars:
+            raise ValueError(f"Expected one of {chars!r} at offset {self.pos}, got {ch!r}")
+        self.pos += 1
+        return ch
+
+    def value(self):
+        """Decode the next complete JSON value"""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number or literal ending exactly at the buffer edge may be truncated
+            if end == len(self.buf) and self._fill():
+                continue
+            self.pos = end
+            return value
+
+
+def _iter_array(stream):
+    if stream.peek() == ']':
+        stream.pos += 1
+        return
+    while True:
+        yield stream.value()
+        if stream.expect(',]') == ']':
+            return
+
+def iter_sections(path='dashboard_data.json'):
+    """Yield (name, value) for each top-level member of the data file.
+
+    List sections are yielded as lazy record iterators; they must be consumed
+    before advancing to the next section (any remainder is skipped).
+    """
+    with open(path, 'r') as f:
+        stream = _Stream(f)
+        stream.expect('{')
+        if stream.peek() == '}':
+            return
+        while True:
+            name = stream.value()
+            stream.expect(':')
+            if stream.peek() == '[':
+                stream.pos += 1
+                records = _iter_array(stream)
+                yield name, records
+                for _ in records:
+                    pass
+            else:
+                yield name, stream.value()
+            if stream.expect(',}') == '}':
+                return
+
+def iter_records(path, section):
+    """Yield the records of a single list section"""
+    for name, value in iter_sections(path):
+        if name == section:
+            yield from value
+            return
+
+def read_sections(path, names):
+    """Materialize only the named sections, skipping the rest of the file"""
+    wanted = set(names)
+    sections = {}
+    for name, value in iter_sections(path):
+        if name in wanted:
+            sections[name] = value if isinstance(value, dict) else list(value)
+            if len(sections) == len(wanted):
+                break
+    return sections
+
+
+def dump_value(value, write):
+    """Serialize one section value through write(); lists and iterators are streamed.
+
+    Returns the number of records written, or None for object sections.
+    """
+    if isinstance(value, dict) or not hasattr(value, '__iter__') or isinstance(value, str):
+        write(json.dumps(value, separators=(',', ':')))
+        return None
+
+    count = 0
+    write('[')
+    for record in value:
+        if count:
+            write(',')
+        write(json.dumps(record, separators=(',', ':')))
+        count += 1
+    write(']')
+    return count
+
+
+class DashboardWriter:
+    """Write a dashboard document section by section.
+
+    Output goes to a temporary sibling file which replaces the target on a
+    clean close, so readers never see a half-written file.
+    """
+
+    def __init__(self, path='dashboard_data.json'):
+        self.path = path
+        self.tmp_path = f"{path}.tmp"
+        self.f = None
+        self.first = True
+
+    def __enter__(self):
+        self.f = open(self.tmp_path, 'w')
+        self.f.write('{')
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.f.write('}')
+            self.f.close()
+            os.replace(self.tmp_path, self.path)
+        else:
+            self.f.close()
+            os.remove(self.tmp_path)
+        return False
+
+    def _start_section(self, name):
+        if not self.first:
+            self.f.write(',')
+        self.first = False
+        self.f.write(json.dumps(name))
+        self.f.write(':')
+
+    def write_section(self, name, value):
+        """Write one top-level member; lists and iterators are streamed.
+
+        Returns the number of records written, or None for object sections.
+        """
+        self._start_section(name)
+        return dump_value(value, self.f.write)
+
+    def write_raw_section(self, name, f):
+        """Copy an already serialized value from an open text file unchanged"""
+        self._start_section(name)
+        shutil.copyfileobj(f, self.f)
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Schema registry and compiled validator for dashboard_data.json
+
+Every section the dashboard renders has a schema here: its required fields, the
+type of each (number, integer or text) and the allowed range or values. Extra
+fields are allowed; the table templates ignore them.
+
+A schema is compiled once per section into a list of column checks. Each check
+reads one field across all rows and tests them together with NumPy. Types are
+found by mapping type() over the column, values by converting it to an array,
+so a section is checked without a Python loop per row. All violations are
+collected in one pass and reported with counts and the first offending rows.
+
+Nothing is patched. Run after normalize_fields.py (whose main() calls
+validate_file()). Bad data makes this script exit non-zero, which fails the build.
+"""
+
+from itertools import repeat
+
+import numpy as np
+
+from dashboard_io import iter_sections
+from normalize_fields import CLUSTERING_ARRAYS, HOLDING_PERIODS, ORTHOGONAL_ARRAYS
+
+MAX_EXAMPLES = 5  # offending rows listed per violation
+
+# Field kinds
+def number(low=None, high=None, required=True):
+    """A finite int or float within [low, high]"""
+    return {"kind": "number", "low": low, "high": high, "required": required}
+
+def integer(low=None, high=None, required=True):
+    """An int within [low, high]"""
+    return {"kind": "integer", "low": low, "high": high, "required": required}
+
+def text(choices=None, required=True):
+    """A non-empty string, one of choices when given"""
+    return {"kind": "text", "choices": choices, "required": required}
+
+
+# Max drawdown is a negative fraction (peak-to-trough fall), as metrics.batch_metrics reports it
+METRIC_FIELDS = {
+    'terminal_value': number(low=0),
+    'annual_return': number(-1, 10),
+    'volatility': number(low=0),
+    'max_drawdown': number(-1, 0),
+    'sharpe_ratio': number(),
+    'sortino_ratio': number(),
+    'calmar_ratio': number(),
+    'win_rate': number(0, 1),
+    'total_trades': integer(low=0),
+}
+TRADED_FIELDS = {**METRIC_FIELDS, 'avg_trades_per_year': number(low=0)}
+
+CLUSTERING_SCHEMA = {
+    'strategy_name': text(),
+    'method_params': text(),
+    'dimensions': integer(low=1),
+    **METRIC_FIELDS,
+}
+
+SCHEMAS = {
+    'individualData': {'indicator': text(), 'transform_type': text(), **TRADED_FIELDS},
+    'combinationData': {'strategy_name': text(), 'indicators_used': text(), **TRADED_FIELDS},
+    'spyBenchmark': {name: spec for name, spec in METRIC_FIELDS.items() if name != 'total_trades'},
+    **{name: CLUSTERING_SCHEMA for name in CLUSTERING_ARRAYS},
+    'spyMLData': {
+        'strategy_name': text(),
+        'model_name': text(),
+        'algorithm': text(),
+        'dimensions': integer(low=1),
+        'holding_period': text(choices=HOLDING_PERIODS),
+        **METRIC_FIELDS,
+    },
+    'technicalIndividualData': {'indicator': text(), 'transform_type': text(), **TRADED_FIELDS},
+    'technicalCombinationData': {
+        'strategy_name': text(),
+        'combination_name': text(),
+        'indicators_used': text(),
+        'components': text(),
+        'indicator': text(),
+        'transform_type': text(choices=['combination']),
+        **TRADED_FIELDS,
+    },
+    'spyClusteringData': {
+        'strategy_name': text(),
+        'method': text(),
+        'dimensions': integer(low=1),
+        'clusters_components': integer(low=0),
+        **METRIC_FIELDS,
+    },
+    **{name: {
+        'strategy_name': text(),
+        'factor': text(),
+        'loading': number(-1, 1),
+        'indicator': text(),
+        'transform_type': text(choices=['orthogonal']),
+        'source_methods': text(),
+        'dimensions': integer(low=1),
+        'correlation': number(-1, 1, required=name != 'combinedOrthogonalData'),
+        **TRADED_FIELDS,
+    } for name in ORTHOGONAL_ARRAYS},
+}
+SCHEMAS['combinedOrthogonalData']['cross_correlation'] = number(-1, 1, required=False)
+
+OBJECT_SECTIONS = ['spyBenchmark']  # a single record rather than a list
+
+# Per-element type codes, mapped over a column in C
+MISSING, INT, FLOAT, TEXT, OTHER = range(5)
+class _Missing:
+    pass
+_MISSING = _Missing()
+TYPE_CODES = {_Missing: MISSING, type(None): MISSING, int: INT, float: FLOAT, str: TEXT}
+KIND_CODES = {'number': [INT, FLOAT], 'integer': [INT], 'text': [TEXT]}
+
+
+def schema_for(name):
+    """Schema of a section; the legacy per-algorithm clustering sections share the clustering schema"""
+    if name in SCHEMAS:
+        return SCHEMAS[name]
+    if name.startswith('macroClustering') and name.endswith('Data'):
+        return CLUSTERING_SCHEMA
+    return None
+
+def _violation(rule, field, mask, column, detail=None):
+    rows = np.flatnonzero(mask)
+    return {
+        "field": field,
+        "rule": rule,
+        "detail": detail,
+        "count": len(rows),
+        "rows": rows[:MAX_EXAMPLES].tolist(),
+        "examples": [None if column[i] is _MISSING else column[i] for i in rows[:MAX_EXAMPLES].tolist()],
+    }
+
+def _compile_field(field, spec):
+    """One field's check: column (list of values) -> violations"""
+    allowed = KIND_CODES[spec['kind']]
+    low, high = spec.get('low'), spec.get('high')
+    choices = set(spec['choices']) if spec.get('choices') else None
+
+    def check(column):
+        codes = np.fromiter(map(TYPE_CODES.get, map(type, column), repeat(OTHER)), dtype=np.int8, count=len(column))
+        missing = codes == MISSING
+        valid = np.isin(codes, allowed)
+        found = []
+        if spec['required'] and missing.any():
+            found.append(_violation('missing', field, missing, column))
+        wrong = ~valid & ~missing
+        if wrong.any():
+            found.append(_violation('type', field, wrong, column, f"expected {spec['kind']}"))
+        if not valid.any():
+            return found
+
+        rows = np.flatnonzero(valid)
+        values = column if len(rows) == len(column) else [column[i] for i in rows.tolist()]
+        bad = {}
+        if spec['kind'] == 'text':
+            bad['empty'] = np.fromiter(map(len, values), dtype=np.int64, count=len(values)) == 0
+            if choices is not None:
+                bad['choices'] = ~np.fromiter(map(choices.__contains__, values), dtype=bool, count=len(values))
+        else:
+            values = np.asarray(values, dtype=np.float64)
+            finite = np.isfinite(values)
+            bad['non_finite'] = ~finite
+            out_of_range = np.zeros(len(values), dtype=bool)
+            if low is not None:
+                out_of_range |= finite & (values < low)
+            if high is not None:
+                out_of_range |= finite & (values > high)
+            bad['range'] = out_of_range
+        details = {'choices': f"one of {sorted(choices) if choices else []}", 'range': f"within [{low}, {high}]"}
+        for rule, mask in bad.items():
+            if mask.any():
+                full = np.zeros(len(column), dtype=bool)
+                full[rows[mask]] = True
+                found.append(_violation(rule, field, full, column, details.get(rule)))
+        return found
+
+    return check
+
+_compiled = {}
+
+def compile_schema(schema):
+    """Compile a schema into validate(records) -> [violation] over a list of row dicts"""
+    checks = [(field, _compile_field(field, spec)) for field, spec in schema.items()]
+
+    def validate(records):
+        return [violation for field, check in checks
+                for violation in check([record.get(field, _MISSING) for record in records])]
+
+    return validate
+
+def validator_for(name):
+    """Compiled validator for a section (compiled on first use), or None when it has no schema"""
+    if name not in _compiled:
+        schema = schema_for(name)
+        _compiled[name] = compile_schema(schema) if schema is not None else None
+    return _compiled[name]
+
+def validate_section(name, value):
+    """Violations of one section, each tagged with the section name"""
+    validate = validator_for(name)
+    if validate is None:
+        found = [{"field": None, "rule": "unknown_section", "detail": "no schema", "count": 1, "rows": [], "examples": []}]
+    elif (name in OBJECT_SECTIONS) != isinstance(value, dict):
+        expected = "an object" if name in OBJECT_SECTIONS else "a list of records"
+        found = [{"field": None, "rule": "shape", "detail": f"expected {expected}", "count": 1, "rows": [], "examples": []}]
+    else:
+        found = validate([value] if isinstance(value, dict) else value)
+    return [dict(violation, section=name) for violation in found]
+
+def validate_file(path='dashboard_data.json'):
+    """Stream the data file through the validators; returns (violations, {section: rows checked})"""
+    violations = []
+    checked = {}
+    for name, value in iter_sections(path):
+        if not isinstance(value, dict):
+            value = list(value)
+        violations.extend(validate_section(name, value))
+        checked[name] = 1 if isinstance(value, dict) else len(value)
+    for name in SCHEMAS:
+        if name not in checked:
+            violations.append({"section": name, "field": None, "rule": "missing_section", "detail": None,
+                               "count": 1, "rows": [], "examples": []})
+    return violations, checked
+
+def print_report(violations):
+    for violation in violations:
+        field = f".{violation['field']}" if violation['field'] else ""
+        detail = f" ({violation['detail']})" if violation['detail'] else ""
+        print(f"  ❌ {violation['section']}{field}: {violation['rule']}{detail}, {violation['count']} rows")
+        if violation['rows']:
+            print(f"      rows {violation['rows']}: {violation['examples']}")
+
+def main():
+    print("🔍 Validating dashboard data against the section schemas...")
+
+    violations, checked = validate_file('dashboard_data.json')
+    total_rows = sum(checked.values())
+    if violations:
+        print(f"❌ {len(violations)} violations in {len({v['section'] for v in violations})} sections "
+              f"({total_rows} rows checked):")
+        print_report(violations)
+        return False
+
+    print(f"✅ {len(checked)} sections and {total_rows} rows match their schemas")
+    return True
+
+if __name__ == "__main__":
+    success = main()
+    exit(0 if success else 1)
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Encode dashboard sections as a compact columnar binary (.dcol)
+
+build_shards.py writes one such bundle per section into data/; running this
+module directly runs that build, so there is no standalone dashboard_data.dcol.
+
+Layout (all little-endian):
+    b"DCOL" | uint32 version | uint32 header length | header JSON | column blocks
+
+The header is the manifest: a shared string dictionary plus, for every section,
+its row count and the byte offset of each column, counted from the end of the
+header (which is padded to 8 bytes). Columns are Float64 ("f64"),
+Int32 ("i32"), or Int32 codes into the string dictionary ("str", -1 = missing).
+Every block starts on an 8-byte boundary so the browser can wrap it in a typed
+array view without copying. Missing numbers are stored as NaN.
+
+With sort_indexes, each numeric column of a records section also gets a
+precomputed ascending sort permutation: Uint32 row indices, stable (ties keep
+row order), missing values last. The section lists them under "sorts" as
+{"column", "offset"}, and the browser applies a header sort without comparing
+rows (descending order is derived from the same index in one pass).
+"""
+
+import json
+import struct
+
+import numpy as np
+
+from strategy_table import StrategyTable
+
+MAGIC = b'DCOL'
+VERSION = 1
+ALIGN = 8
+INT32_MIN, INT32_MAX = -2**31, 2**31 - 1
+
+def _pad(length):
+    return (-length) % ALIGN
+
+class _StringDictionary:
+    """Shared string table; each distinct string is stored once per file"""
+
+    def __init__(self):
+        self.strings = []
+        self.codes = {}
+
+    def encode(self, values):
+        codes = np.empty(len(values), dtype='<i4')
+        for i, value in enumerate(values):
+            if value is None:
+                codes[i] = -1
+                continue
+            code = self.codes.get(value)
+            if code is None:
+                code = self.codes[value] = len(self.strings)
+                self.strings.append(value)
+            codes[i] = code
+        return codes
+
+def _encode_column(values, strings):
+    """Return (type, little-endian bytes) for one column array"""
+    if values.dtype.kind in 'iu' and (len(values) == 0 or (values.min() >= INT32_MIN and values.max() <= INT32_MAX)):
+        return 'i32', values.astype('<i4').tobytes()
+    if values.dtype.kind in 'iuf':
+        return 'f64', values.astype('<f8').tobytes()
+    if not all(value is None or isinstance(value, str) for value in values):
+        # Rare non-string objects travel as JSON text in the string dictionary
+        values = [None if value is None else json.dumps(value) for value in values]
+        return 'json', strings.encode(values).tobytes()
+    return 'str', strings.encode(values).tobytes()
+
+def sort_index(values):
+    """Stable ascending argsort as little-endian uint32; NaN sorts last"""
+    return np.argsort(values, kind='stable').astype('<u4')
+
+def encode_sections(sections, sort_indexes=False):
+    """Encode (name, value) pairs into one columnar bundle.
+
+    List sections become tables; object sections (e.g. spyBenchmark) are stored
+    as a single-row table with kind "object". sort_indexes adds a sort
+    permutation for every numeric column of list sections.
+    """
+    strings = _StringDictionary()
+    manifest = []
+    blocks = []
+    offset = 0
+
+    for name, value in sections:
+        kind = 'object' if isinstance(value, dict) else 'records'
+        table = StrategyTable.from_records([value] if kind == 'object' else value)
+        columns = []
+        for column, values in table.columns.items():
+            column_type, data = _encode_column(values, strings)
+            columns.append({"name": column, "type": column_type, "offset": offset})
+            blocks.append(data + b'\0' * _pad(len(data)))
+            offset += len(blocks[-1])
+        entry = {"name": name, "kind": kind, "length": len(table), "columns": columns}
+
+        if sort_indexes and kind == 'records':
+            entry['sorts'] = []
+            for column, values in table.columns.items():
+                if values.dtype.kind not in 'iuf':
+                    continue
+                data = sort_index(values).tobytes()
+                entry['sorts'].append({"column": column, "offset": offset})
+                blocks.append(data + b'\0' * _pad(len(data)))
+                offset += len(blocks[-1])
+
+        manifest.append(entry)
+
+    header = json.dumps({"strings": strings.strings, "sections": manifest}, separators=(',', ':')).encode('utf-8')
+    header += b' ' * _pad(12 + len(header))
+
+    return MAGIC + struct.pack('<II', VERSION, len(header)) + header + b''.join(blocks)
+
+def main():
+    # The page loads per-section shards, so exporting means building them
+    import build_shards
+    return build_shards.main()
+
+if __name__ == "__main__":
+    success = main()
+    exit(0 if success else 1)
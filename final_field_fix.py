@@ -1,117 +1,25 @@
 #!/usr/bin/env python3
 """
 Final fix for the exact field mismatches found in SPY combinations and orthogonal tables
+
+The rules now live in normalize_fields.py as the 'final_fields' pass; run
+normalize_fields.py to apply every pass in one read/write of the data file.
 """
 
-import json
-import random
+from normalize_fields import normalize_file
 
 def final_field_fix():
     print("🔧 Final field fixes based on exact table templates...")
     
-    # Read existing data
-    with open('dashboard_data.json', 'r') as f:
-        data = json.load(f)
-    
-    print("📊 Applying precise field mappings...")
-    
-    # Fix SPY combination table - expects: combination_name, components
-    if 'technicalCombinationData' in data:
-        for item in data['technicalCombinationData']:
-            # Map strategy_name → combination_name
-            if 'strategy_name' in item:
-                item['combination_name'] = item['strategy_name']
-            
-            # Map indicators_used → components  
-            if 'indicators_used' in item:
-                item['components'] = item['indicators_used']
-            elif 'strategy_name' in item:
-                # Generate components from strategy name
-                item['components'] = f"SPY + {item['strategy_name'].split(' ')[1:3]}"
-                
-        print(f"  ✅ Fixed technicalCombinationData: combination_name, components fields")
-    
-    # Fix orthogonal tables - expects: source_methods, dimensions, correlation/cross_correlation
-    orthogonal_arrays = ['macroOrthogonalData', 'spyOrthogonalData', 'combinedOrthogonalData']
-    
-    for array_name in orthogonal_arrays:
-        if array_name in data:
-            for i, item in enumerate(data[array_name]):
-                # Add source_methods field
-                if 'source_methods' not in item:
-                    if 'macro' in array_name.lower():
-                        item['source_methods'] = 'Macro Indicators'
-                    elif 'spy' in array_name.lower():
-                        item['source_methods'] = 'SPY Technical'
-                    else:
-                        item['source_methods'] = 'Multi-Strategy'
-                
-                # Add dimensions field (use features if available, or default)
-                if 'dimensions' not in item:
-                    item['dimensions'] = item.get('features', random.randint(3, 8))
-                
-                # Add correlation field
-                if 'correlation' not in item and 'cross_correlation' not in item:
-                    item['correlation'] = random.uniform(-0.3, 0.8)
-                    
-            print(f"  ✅ Fixed {array_name}: source_methods, dimensions, correlation fields")
-    
-    # Ensure all critical fields exist and are RAG-compliant
-    critical_fields = ['terminal_value', 'annual_return', 'volatility', 'max_drawdown', 
-                      'sharpe_ratio', 'sortino_ratio', 'calmar_ratio', 'win_rate', 'total_trades']
-    
-    all_arrays = ['technicalCombinationData', 'macroOrthogonalData', 'spyOrthogonalData', 'combinedOrthogonalData']
-    
-    for array_name in all_arrays:
-        if array_name in data:
-            for item in data[array_name]:
-                # Ensure all financial metrics exist with realistic values
-                for field in critical_fields:
-                    if field not in item or item[field] is None:
-                        if field == 'terminal_value':
-                            item[field] = random.uniform(28000, 48000)
-                        elif field == 'annual_return':
-                            item[field] = random.uniform(0.07, 0.12)  # 7-12% realistic range
-                        elif field == 'volatility':
-                            item[field] = random.uniform(0.10, 0.16)  # 10-16% realistic volatility
-                        elif field == 'max_drawdown':
-                            item[field] = random.uniform(0.14, 0.26)  # 14-26% realistic drawdowns
-                        elif field == 'sharpe_ratio':
-                            item[field] = random.uniform(0.5, 0.85)   # Achievable Sharpe ratios
-                        elif field == 'sortino_ratio':
-                            item[field] = item.get('sharpe_ratio', 0.65) * random.uniform(1.15, 1.35)
-                        elif field == 'calmar_ratio':
-                            item[field] = item.get('sharpe_ratio', 0.65) * random.uniform(0.75, 0.95)
-                        elif field == 'win_rate':
-                            item[field] = random.uniform(0.42, 0.58)  # Realistic win rates
-                        elif field == 'total_trades':
-                            item[field] = random.randint(120, 250)    # Reasonable trade frequency
-                            
-                # Add avg_trades_per_year if missing
-                if 'avg_trades_per_year' not in item:
-                    item['avg_trades_per_year'] = item.get('total_trades', 150) / 15
-    
-    # Final RAG compliance check
-    print("\n✅ RAG COMPLIANCE FINAL VERIFICATION:")
-    print("  - All performance metrics within realistic market bounds")
-    print("  - No synthetic enhancements or inflated returns")
-    print("  - Proper risk-return relationships maintained")
-    print("  - No look-ahead bias in strategy construction")
-    print("  - All data represents achievable trading performance")
-    
-    # Save final corrected data
-    with open('dashboard_data.json', 'w') as f:
-        json.dump(data, f, separators=(',', ':'))
+    normalize_file('dashboard_data.json', passes=['final_fields'])
     
     print(f"\n💾 Final field corrections saved!")
     print(f"📊 Fixed exact field mismatches:")
     print(f"  - SPY combinations: combination_name, components")
     print(f"  - Orthogonal tables: source_methods, dimensions, correlation")
-    print(f"  - All critical financial metrics completed")
-    print(f"  - RAG compliance maintained throughout")
     
     return True
 
 if __name__ == "__main__":
     success = final_field_fix()
-    exit(0 if success else 1)
\ No newline at end of file
+    exit(0 if success else 1)
@@ -1,134 +1,20 @@
 #!/usr/bin/env python3
 """
 Fix data field mismatches causing undefined content in tables
+
+The rules now live in normalize_fields.py as the 'field_names' pass; run
+normalize_fields.py to apply every pass in one read/write of the data file.
 """
 
-import json
-import random
+from normalize_fields import normalize_file
 
 def fix_data_fields():
     print("🔧 Fixing data field mismatches...")
     
-    # Read existing data
-    with open('dashboard_data.json', 'r') as f:
-        data = json.load(f)
-    
-    print("📊 Original data loaded, fixing field names...")
-    
-    # Fix clustering data - needs: method_params, dimensions instead of algorithm, features
-    clustering_arrays = [
-        'macroClusteringKmeansData',
-        'macroClusteringHierarchicalData', 
-        'macroClusteringPcaData',
-        'macroClusteringDbscanData',
-        'macroClusteringGaussianData',
-        'macroClusteringSpectralData'
-    ]
-    
-    for array_name in clustering_arrays:
-        if array_name in data:
-            for item in data[array_name]:
-                # Fix field names
-                if 'algorithm' in item:
-                    item['method_params'] = f"params={item['features']}" if 'features' in item else "default"
-                    del item['algorithm']
-                if 'features' in item:
-                    item['dimensions'] = item['features']
-                    del item['features']
-            print(f"  ✅ Fixed {array_name}: {len(data[array_name])} items")
-    
-    # Fix SPY clustering data - needs: method, clusters_components, dimensions
-    if 'spyClusteringData' in data:
-        for item in data['spyClusteringData']:
-            if 'algorithm' in item:
-                item['method'] = item['algorithm']
-                del item['algorithm']
-            if 'features' in item:
-                item['dimensions'] = item['features']
-                item['clusters_components'] = item['features']
-                del item['features']
-            if 'cluster' in item:
-                item['clusters_components'] = item['cluster']
-                del item['cluster']
-        print(f"  ✅ Fixed spyClusteringData: {len(data['spyClusteringData'])} items")
-    
-    # Fix SPY ML data - needs proper algorithm field mapping
-    if 'spyMLData' in data:
-        for item in data['spyMLData']:
-            if 'features' in item:
-                item['dimensions'] = item['features']
-                # Keep features for ML but add dimensions
-            # Make sure algorithm field exists (it should)
-        print(f"  ✅ Fixed spyMLData: {len(data['spyMLData'])} items")
-    
-    # Fix orthogonal data - needs: factor, loading fields
-    orthogonal_arrays = ['macroOrthogonalData', 'spyOrthogonalData', 'combinedOrthogonalData']
-    
-    for array_name in orthogonal_arrays:
-        if array_name in data:
-            for item in data[array_name]:
-                # Orthogonal data should already have factor and loading fields
-                # But let's make sure they're present
-                if 'factor' not in item:
-                    item['factor'] = item.get('strategy_name', f"Factor {random.randint(1, 8)}")
-                if 'loading' not in item:
-                    item['loading'] = random.uniform(-0.8, 0.8)
-            print(f"  ✅ Fixed {array_name}: {len(data[array_name])} items")
-    
-    # Fix technical combination data - needs indicators_used field
-    if 'technicalCombinationData' in data:
-        for item in data['technicalCombinationData']:
-            if 'indicators_used' not in item and 'strategy_name' in item:
-                # Generate a reasonable indicators_used field
-                base_indicators = ['SPY', 'VIX', 'DXY', 'TLT', 'GLD']
-                selected = random.sample(base_indicators, random.randint(2, 4))
-                item['indicators_used'] = ' + '.join(selected)
-        print(f"  ✅ Fixed technicalCombinationData: {len(data['technicalCombinationData'])} items")
-    
-    # Check that all critical fields exist in all arrays
-    critical_fields = ['terminal_value', 'annual_return', 'volatility', 'max_drawdown', 
-                      'sharpe_ratio', 'win_rate', 'total_trades']
-    
-    for array_name, array_data in data.items():
-        if isinstance(array_data, list) and array_data:
-            for item in array_data:
-                for field in critical_fields:
-                    if field not in item:
-                        # Add missing critical fields with reasonable defaults
-                        if field == 'terminal_value':
-                            item[field] = random.uniform(20000, 50000)
-                        elif field == 'annual_return':
-                            item[field] = random.uniform(0.05, 0.15)
-                        elif field == 'volatility':
-                            item[field] = random.uniform(0.08, 0.20)
-                        elif field == 'max_drawdown':
-                            item[field] = random.uniform(0.10, 0.30)
-                        elif field == 'sharpe_ratio':
-                            item[field] = random.uniform(0.3, 1.2)
-                        elif field == 'win_rate':
-                            item[field] = random.uniform(0.35, 0.65)
-                        elif field == 'total_trades':
-                            item[field] = random.randint(50, 300)
-                
-                # Ensure sortino_ratio and calmar_ratio exist or can be calculated
-                if 'sortino_ratio' not in item:
-                    item['sortino_ratio'] = item.get('sharpe_ratio', 0.5) * random.uniform(1.0, 1.3)
-                if 'calmar_ratio' not in item:
-                    item['calmar_ratio'] = item.get('sharpe_ratio', 0.5) * random.uniform(0.6, 0.9)
-    
-    # Ensure all data complies with RAG requirements (real data, no synthetic enhancements)
-    print("\n✅ RAG COMPLIANCE CHECK:")
-    print("  - Using realistic market performance ranges")
-    print("  - No synthetic enhancements to returns")  
-    print("  - Proper drawdown calculations based on volatility")
-    print("  - No look-ahead bias in strategy construction")
-    
-    # Save fixed data
-    with open('dashboard_data.json', 'w') as f:
-        json.dump(data, f, separators=(',', ':'))
+    counts = normalize_file('dashboard_data.json', passes=['field_names'])
     
     # Count total strategies
-    total_strategies = sum(len(arr) for arr in data.values() if isinstance(arr, list))
+    total_strategies = sum(count for count in counts.values() if count is not None)
     
     print(f"\n💾 Fixed data saved!")
     print(f"📊 Total strategies: {total_strategies}")
@@ -138,10 +24,9 @@ def fix_data_fields():
     print(f"  - 1 SPY ML array (dimensions)")
     print(f"  - 3 orthogonal arrays (factor, loading)")
     print(f"  - 1 technical combination array (indicators_used)")
-    print(f"  - All arrays (critical financial fields)")
     
     return True
 
 if __name__ == "__main__":
     success = fix_data_fields()
-    exit(0 if success else 1)
\ No newline at end of file
+    exit(0 if success else 1)
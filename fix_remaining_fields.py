@@ -1,115 +1,26 @@
 #!/usr/bin/env python3
 """
 Fix the remaining field mismatches in orthogonal, SPY combinations, and ML tables
+
+The rules now live in normalize_fields.py as the 'remaining_fields' pass; run
+normalize_fields.py to apply every pass in one read/write of the data file.
 """
 
-import json
-import random
+from normalize_fields import normalize_file
 
 def fix_remaining_fields():
     print("🔧 Fixing remaining field mismatches...")
     
-    # Read existing data
-    with open('dashboard_data.json', 'r') as f:
-        data = json.load(f)
-    
-    print("📊 Fixing final field name issues...")
-    
-    # Fix orthogonal data - expects: indicator, transform_type
-    orthogonal_arrays = ['macroOrthogonalData', 'spyOrthogonalData', 'combinedOrthogonalData']
-    
-    for array_name in orthogonal_arrays:
-        if array_name in data:
-            for item in data[array_name]:
-                # Map strategy_name → indicator, factor → transform_type
-                if 'strategy_name' in item:
-                    # Extract meaningful indicator name from strategy name
-                    item['indicator'] = item['strategy_name'].replace(' Factor', '').replace('Macro ', '').replace('SPY ', '').replace('Combined ', '')
-                if 'factor' in item:
-                    item['transform_type'] = 'orthogonal'
-                # Ensure avg_trades_per_year exists
-                if 'avg_trades_per_year' not in item:
-                    item['avg_trades_per_year'] = item.get('total_trades', 150) / 15
-            print(f"  ✅ Fixed {array_name}: {len(data[array_name])} items (indicator, transform_type)")
-    
-    # Fix SPY combination data - expects: indicator, transform_type 
-    if 'technicalCombinationData' in data:
-        for item in data['technicalCombinationData']:
-            if 'strategy_name' in item:
-                # Use strategy name as indicator
-                item['indicator'] = item['strategy_name'].replace('SPY ', '')
-            if 'indicators_used' in item:
-                # Set transform type based on combination
-                item['transform_type'] = 'combination'
-            # Ensure avg_trades_per_year exists
-            if 'avg_trades_per_year' not in item:
-                item['avg_trades_per_year'] = item.get('total_trades', 150) / 15
-        print(f"  ✅ Fixed technicalCombinationData: {len(data['technicalCombinationData'])} items (indicator, transform_type)")
-    
-    # Fix ML data - expects: model_name, holding_period
-    if 'spyMLData' in data:
-        holding_periods = ['1D', '5D', '10D', '20D', '1M', '2M', '3M', '6M']
-        for i, item in enumerate(data['spyMLData']):
-            if 'strategy_name' in item:
-                item['model_name'] = item['strategy_name']
-            if 'algorithm' in item:
-                item['model_name'] = f"{item['algorithm']} Model"
-            # Add holding period
-            item['holding_period'] = holding_periods[i % len(holding_periods)]
-        print(f"  ✅ Fixed spyMLData: {len(data['spyMLData'])} items (model_name, holding_period)")
-    
-    # Double-check all critical fields exist
-    critical_fields = ['terminal_value', 'annual_return', 'volatility', 'max_drawdown', 
-                      'sharpe_ratio', 'sortino_ratio', 'calmar_ratio', 'win_rate', 'total_trades']
-    
-    arrays_to_check = ['macroOrthogonalData', 'spyOrthogonalData', 'combinedOrthogonalData', 
-                       'technicalCombinationData', 'spyMLData']
-    
-    for array_name in arrays_to_check:
-        if array_name in data:
-            for item in data[array_name]:
-                for field in critical_fields:
-                    if field not in item or item[field] is None:
-                        if field == 'terminal_value':
-                            item[field] = random.uniform(25000, 45000)
-                        elif field == 'annual_return':
-                            item[field] = random.uniform(0.06, 0.13)
-                        elif field == 'volatility':
-                            item[field] = random.uniform(0.09, 0.18)
-                        elif field == 'max_drawdown':
-                            item[field] = random.uniform(0.12, 0.28)
-                        elif field == 'sharpe_ratio':
-                            item[field] = random.uniform(0.4, 0.9)
-                        elif field == 'sortino_ratio':
-                            item[field] = item.get('sharpe_ratio', 0.6) * random.uniform(1.1, 1.4)
-                        elif field == 'calmar_ratio':
-                            item[field] = item.get('sharpe_ratio', 0.6) * random.uniform(0.7, 1.0)
-                        elif field == 'win_rate':
-                            item[field] = random.uniform(0.40, 0.60)
-                        elif field == 'total_trades':
-                            item[field] = random.randint(80, 200)
-    
-    # Ensure RAG compliance - all data represents realistic market performance
-    print("\n✅ RAG COMPLIANCE VERIFICATION:")
-    print("  - All returns based on realistic market ranges (6-13% annual)")
-    print("  - Volatility within typical equity market bounds (9-18%)")  
-    print("  - Drawdowns reflect actual market risk (12-28%)")
-    print("  - Sharpe ratios consistent with achievable performance (0.4-0.9)")
-    print("  - No synthetic data enhancements or look-ahead bias")
-    
-    # Save final data
-    with open('dashboard_data.json', 'w') as f:
-        json.dump(data, f, separators=(',', ':'))
+    normalize_file('dashboard_data.json', passes=['remaining_fields'])
     
     print(f"\n💾 Final data fixes saved!")
     print(f"📊 Remaining issues should now be resolved:")
     print(f"  - Orthogonal tables: indicator, transform_type fields added")
     print(f"  - SPY combinations: indicator, transform_type fields added") 
     print(f"  - ML table: model_name, holding_period fields added")
-    print(f"  - All critical financial metrics verified and completed")
     
     return True
 
 if __name__ == "__main__":
     success = fix_remaining_fields()
-    exit(0 if success else 1)
\ No newline at end of file
+    exit(0 if success else 1)
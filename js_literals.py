@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Extract JavaScript object/array literals (const X = [...] / {...}) without eval
+
+Legacy dashboards embed their data as inline `const individualData = [...]`
+declarations. extract_const_literals() walks the page once: each declaration
+is located, its literal parsed and the scan resumes after the literal, so text
+inside data strings is never mistaken for another declaration.
+
+Parsing is tiered so large files stay fast. Literals written as strict JSON
+go straight to the C JSON decoder. JS-style literals (unquoted keys,
+single-quoted strings, trailing commas, comments, undefined) are rewritten to
+JSON with whole-text regex passes and decoded the same way. Anything else
+(hex numbers, JS-only escapes, numeric keys) goes through a small tokenizer.
+Only literal values are accepted; identifiers, calls and template strings
+raise JSLiteralError.
+"""
+
+import json
+import re
+
+_JSON = json.JSONDecoder()
+
+_CONST = re.compile(r'const\s+([A-Za-z_$][\w$]*)\s*=\s*(?=[\[{])')
+
+_TOKEN = re.compile(r'''
+    (?P<skip>(?:\s+|//[^\n]*|/\*.*?\*/)+)
+  | (?P<punct>[\[\]{}:,])
+  | (?P<dstring>"(?:[^"\\\n]|\\.|\\\n)*")
+  | (?P<sstring>'(?:[^'\\\n]|\\.|\\\n)*')
+  | (?P<number>[+-]?(?:0[xX][0-9a-fA-F]+|(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?|Infinity))
+  | (?P<name>[A-Za-z_$][\w$]*)
+''', re.VERBOSE | re.DOTALL)
+
+# Strings and comments, split out so the JSON rewrite only touches code
+_SEGMENT = re.compile(r'''("[^"\\\n]*(?:\\.[^"\\\n]*)*"|'[^'\\\n]*(?:\\.[^'\\\n]*)*'|//[^\n]*|/\*.*?\*/)''', re.DOTALL)
+_UNDEFINED = re.compile(r'\bundefined\b(?!\s*:)')
+_BARE_KEY = re.compile(r'([{,]\s*)([A-Za-z_$][\w$]*)(?=\s*:)')
+_TRAILING_COMMA = re.compile(r',(\s*[\]}])')
+_PLACEHOLDER = '\0'
+
+_CONSTANTS = {'true': True, 'false': False, 'null': None, 'undefined': None, 'NaN': float('nan'), 'Infinity': float('inf')}
+
+_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0', '\n': ''}
+_ESCAPE = re.compile(r'\\(u\{[0-9a-fA-F]+\}|u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|.)', re.DOTALL)
+
+class JSLiteralError(ValueError):
+    def __init__(self, message, text, pos):
+        line = text.count('\n', 0, pos) + 1
+        column = pos - text.rfind('\n', 0, pos)
+        super().__init__(f"{message} at line {line} column {column}")
+        self.pos = pos
+
+def _unescape(match):
+    escape = match.group(1)
+    if escape[0] in 'ux' and len(escape) > 1:
+        return chr(int(escape[1:].strip('{}'), 16))
+    return _ESCAPES.get(escape, escape)
+
+def _string(token):
+    body = token[1:-1]
+    return _ESCAPE.sub(_unescape, body) if '\\' in body else body
+
+def _number(token):
+    sign = -1 if token[0] == '-' else 1
+    digits = token.lstrip('+-')
+    if digits == 'Infinity':
+        return sign * float('inf')
+    if digits[:2] in ('0x', '0X'):
+        return sign * int(digits, 16)
+    if '.' in digits or 'e' in digits or 'E' in digits:
+        return sign * float(digits)
+    return sign * int(digits)
+
+class _Parser:
+    def __init__(self, text, pos):
+        self.text = text
+        self.pos = pos
+
+    def next(self):
+        """Return (kind, token) for the next significant token"""
+        match = _TOKEN.match(self.text, self.pos)
+        if match and match.lastgroup == 'skip':
+            self.pos = match.end()
+            match = _TOKEN.match(self.text, self.pos)
+        if not match:
+            if self.pos >= len(self.text):
+                raise JSLiteralError("Unexpected end of input", self.text, self.pos)
+            raise JSLiteralError("Unexpected character", self.text, self.pos)
+        self.pos = match.end()
+        return match.lastgroup, match.group()
+
+    def error(self, message, token):
+        return JSLiteralError(f"{message} {token!r}", self.text, self.pos - len(token))
+
+    def value(self, kind=None, token=None):
+        if kind is None:
+            kind, token = self.next()
+        if kind == 'punct':
+            if token == '[':
+                return self.array()
+            if token == '{':
+                return self.object()
+        elif kind == 'dstring' or kind == 'sstring':
+            return _string(token)
+        elif kind == 'number':
+            return _number(token)
+        elif kind == 'name' and token in _CONSTANTS:
+            return _CONSTANTS[token]
+        raise self.error("Unexpected token", token)
+
+    def array(self):
+        items = []
+        while True:
+            kind, token = self.next()
+            if token == ']':
+                return items
+            items.append(self.value(kind, token))
+            kind, token = self.next()
+            if token == ']':
+                return items
+            if token != ',':
+                raise self.error("Expected ',' or ']' but found", token)
+
+    def object(self):
+        members = {}
+        while True:
+            kind, token = self.next()
+            if token == '}':
+                return members
+            if kind == 'dstring' or kind == 'sstring':
+                key = _string(token)
+            elif kind == 'name' or kind == 'number':
+                key = token
+            else:
+                raise self.error("Expected property name but found", token)
+            kind, token = self.next()
+            if token != ':':
+                raise self.error("Expected ':' but found", token)
+            members[key] = self.value()
+            kind, token = self.next()
+            if token == '}':
+                return members
+            if token != ',':
+                raise self.error("Expected ',' or '}' but found", token)
+
+def _as_json(source, trailing_commas=False):
+    """Rewrite JS literal source as JSON text, or None if it cannot be done safely.
+
+    Stripping trailing commas is a full pass over the code that is rarely
+    needed, so callers only ask for it after a plain rewrite fails to decode.
+    """
+    if _PLACEHOLDER in source:
+        return None
+    segments = _SEGMENT.split(source)
+    strings = []
+    code = []
+    for i, segment in enumerate(segments):
+        if i % 2 == 0:
+            code.append(segment)
+        elif segment[0] == '/':
+            code.append(' ')
+        else:
+            code.append(_PLACEHOLDER)
+            strings.append(segment if segment[0] == '"' else json.dumps(_string(segment)))
+    code = ''.join(code)
+    if 'undefined' in code:
+        code = _UNDEFINED.sub('null', code)
+    # Split rather than sub with a template: every third piece is a key, quoted in one pass
+    pieces = _BARE_KEY.split(code)
+    pieces[2::3] = ['"' + key + '"' for key in pieces[2::3]]
+    code = ''.join(pieces)
+    if trailing_commas:
+        code = _TRAILING_COMMA.sub(r'\1', code)
+    pieces = code.split(_PLACEHOLDER)
+    output = [pieces[0]]
+    for string, piece in zip(strings, pieces[1:]):
+        output.append(string)
+        output.append(piece)
+    return ''.join(output)
+
+def parse_literal(text, pos=0, end=None):
+    """Parse the JS literal starting at text[pos]; returns (value, end position).
+
+    end, when given, bounds the literal (e.g. the start of the next
+    declaration) and enables the JS-to-JSON fast path. Decoding a bounded
+    chunk also keeps failed attempts cheap: JSONDecodeError counts lines from
+    the start of whatever string it was handed.
+    """
+    chunk = text[pos:end]
+    try:
+        value, length = _JSON.raw_decode(chunk)
+        return value, pos + length
+    except ValueError:
+        pass
+    if end is not None:
+        for trailing_commas in (False, True):
+            source = _as_json(chunk, trailing_commas)
+            if source is None:
+                break
+            try:
+                value, _ = _JSON.raw_decode(source)
+                return value, end
+            except ValueError:
+                pass
+    parser = _Parser(text, pos)
+    value = parser.value()
+    return value, parser.pos
+
+def extract_const_literals(text, names=None):
+    """Parse every `const NAME = [...]` / `{...}` declaration in text.
+
+    Returns (literals, errors): literals maps name -> value in source order,
+    errors maps name -> message for declarations that are not plain literals.
+    When a name is declared more than once the first declaration wins. If
+    names is given, other declarations are still parsed (to skip past them)
+    but not returned.
+    """
+    wanted = set(names) if names is not None else None
+    literals = {}
+    errors = {}
+    pos = 0
+    declarations = list(_CONST.finditer(text))
+    for i, match in enumerate(declarations):
+        start = match.start()
+        if start < pos or (start > 0 and (text[start - 1].isalnum() or text[start - 1] in '_$')):
+            # Inside the previous literal (e.g. in a string value), or part of a longer identifier
+            continue
+        name = match.group(1)
+        end = declarations[i + 1].start() if i + 1 < len(declarations) else len(text)
+        try:
+            value, pos = parse_literal(text, match.end(), end)
+        except JSLiteralError as e:
+            pos = match.end() + 1
+            if (wanted is None or name in wanted) and name not in literals:
+                errors.setdefault(name, str(e))
+            continue
+        if (wanted is None or name in wanted) and name not in literals:
+            literals[name] = value
+            errors.pop(name, None)
+    return literals, errors
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Batch performance metrics over a strategies x days matrix of daily returns
+
+batch_metrics() computes every dashboard metric for all rows with NumPy
+reductions. The matrix is read in blocks of ROW_CHUNK strategies x DAY_CHUNK
+days, and each row's running state (compounded equity, running peak, worst
+drawdown, return moments) is carried from one day block to the next. Memory
+stays bounded by the block size, so inputs can be np.memmap arrays or .npy
+files far larger than RAM. For example, the strategy returns saved by
+backtest.py, or returns of candidate combinations.
+"""
+
+import numpy as np
+
+INITIAL_CAPITAL = 10000
+PERIODS_PER_YEAR = 252
+ROW_CHUNK = 4096
+DAY_CHUNK = 2048
+
+METRICS = [
+    'terminal_value', 'annual_return', 'volatility', 'max_drawdown',
+    'sharpe_ratio', 'sortino_ratio', 'calmar_ratio'
+]
+
+def open_returns(returns):
+    """Accept an array, a memmap or the path of a .npy file (memory-mapped read-only)"""
+    returns = np.load(returns, mmap_mode='r') if isinstance(returns, str) else np.asarray(returns)
+    return returns[None, :] if returns.ndim == 1 else returns
+
+def _block_state(block, initial):
+    """Per-row running state of one row block, advanced over its day blocks"""
+    rows = block.shape[0]
+    state = {
+        "equity": np.full(rows, float(initial)),
+        "peak": np.full(rows, float(initial)),
+        "max_drawdown": np.zeros(rows),
+        "count": 0,
+        "mean": np.zeros(rows),
+        "m2": np.zeros(rows),          # sum of squared deviations from the mean
+        "downside": np.zeros(rows),    # sum of squared negative returns
+    }
+    for start in range(0, block.shape[1], DAY_CHUNK):
+        days = np.asarray(block[:, start:start + DAY_CHUNK], dtype=np.float64)
+        n = days.shape[1]
+
+        # Equity and drawdown continue from the previous block's close and peak
+        equity = state["equity"][:, None] * np.cumprod(1 + days, axis=1)
+        peaks = np.maximum(np.maximum.accumulate(equity, axis=1), state["peak"][:, None])
+        state["max_drawdown"] = np.minimum(state["max_drawdown"], (equity / peaks - 1).min(axis=1))
+        state["equity"] = equity[:, -1]
+        state["peak"] = peaks[:, -1]
+
+        # Merge the block's mean and squared deviations into the running moments (Chan et al.)
+        block_mean = days.mean(axis=1)
+        block_m2 = ((days - block_mean[:, None]) ** 2).sum(axis=1)
+        total = state["count"] + n
+        delta = block_mean - state["mean"]
+        state["m2"] += block_m2 + delta ** 2 * state["count"] * n / total
+        state["mean"] += delta * n / total
+        state["count"] = total
+        state["downside"] += (np.minimum(days, 0) ** 2).sum(axis=1)
+    return state
+
+def batch_metrics(returns, initial=INITIAL_CAPITAL, periods_per_year=PERIODS_PER_YEAR, row_chunk=ROW_CHUNK):
+    """{metric: array} for each row of a strategies x days returns matrix.
+
+    max_drawdown is negative (peak-to-trough fall of compounded equity), as in
+    individualData. Ratios are 0 where their denominator is. Raises ValueError
+    for a matrix with no days, which has no return to annualize.
+    """
+    returns = open_returns(returns)
+    strategies, days = returns.shape
+    if days == 0:
+        raise ValueError("batch_metrics needs at least one day of returns, got 0")
+    out = {name: np.empty(strategies) for name in METRICS}
+    years = days / periods_per_year
+    scale = np.sqrt(periods_per_year)
+
+    for start in range(0, strategies, row_chunk):
+        rows = slice(start, start + row_chunk)
+        state = _block_state(returns[rows], initial)
+        mean = state["mean"]
+        std = np.sqrt(state["m2"] / max(days - 1, 1))
+        downside = np.sqrt(state["downside"] / max(days, 1))
+        max_drawdown = state["max_drawdown"]
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            annual_return = (state["equity"] / initial) ** (1 / years) - 1
+            out["sharpe_ratio"][rows] = np.where(std > 0, mean / std * scale, 0.0)
+            out["sortino_ratio"][rows] = np.where(downside > 0, mean / downside * scale, 0.0)
+            out["calmar_ratio"][rows] = np.where(max_drawdown < 0, annual_return / -max_drawdown, 0.0)
+        out["terminal_value"][rows] = state["equity"]
+        out["annual_return"][rows] = annual_return
+        out["volatility"][rows] = std * scale
+        out["max_drawdown"][rows] = max_drawdown
+
+    return out
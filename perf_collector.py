@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Local collector for the dashboard's timing beacons
+
+index.html posts its timing spans (window.__dashboardPerf) to PERF_BEACON_URL
+when that is set. This server accepts those POSTs on http://HOST:PORT/perf,
+appends each payload as one line to LOG_FILE and prints a one-line summary of
+the slowest span, so a slow table or section shows up while you click around.
+Stop it with Ctrl+C.
+"""
+
+import asyncio
+import json
+import time
+
+HOST = '127.0.0.1'
+PORT = 8799
+PATH = '/perf'
+LOG_FILE = 'perf_log.jsonl'
+MAX_BODY = 1 << 20
+
+def summarize(payload):
+    spans = payload.get('spans') or []
+    ready = payload.get('ready') or {}
+    slowest = max(spans, key=lambda span: span.get('duration', 0), default=None)
+    parts = [f"{len(spans)} spans"]
+    if ready:
+        parts.append(f"ready ({ready.get('mode')}) at {ready.get('time', 0):.0f}ms")
+    if slowest:
+        parts.append(f"slowest {slowest['name']} {slowest['duration']:.1f}ms {json.dumps(slowest.get('detail'))}")
+    return ', '.join(parts)
+
+async def handle(reader, writer):
+    try:
+        head = await reader.readuntil(b'\r\n\r\n')
+        lines = head.decode('latin-1').split('\r\n')
+        method, target, _ = lines[0].split(' ', 2)
+        headers = {k.strip().lower(): v.strip() for k, _, v in (line.partition(':') for line in lines[1:] if line)}
+        length = int(headers.get('content-length', 0))
+
+        status = '204 No Content'
+        if method == 'POST' and target.split('?')[0] == PATH and 0 < length <= MAX_BODY:
+            body = await reader.readexactly(length)
+            try:
+                payload = json.loads(body)
+            except ValueError:
+                status = '400 Bad Request'
+            else:
+                with open(LOG_FILE, 'a') as f:
+                    f.write(json.dumps({"received": time.strftime('%Y-%m-%dT%H:%M:%S'), **payload}) + '\n')
+                print(f"📥 {payload.get('page', '?')}: {summarize(payload)}")
+        elif method != 'OPTIONS':
+            status = '404 Not Found'
+
+        writer.write((f"HTTP/1.1 {status}\r\nContent-Length: 0\r\nConnection: close\r\n"
+                      "Access-Control-Allow-Origin: *\r\nAccess-Control-Allow-Headers: Content-Type\r\n\r\n").encode('latin-1'))
+        await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+        pass
+    finally:
+        writer.close()
+
+async def serve():
+    server = await asyncio.start_server(handle, HOST, PORT)
+    print(f"📡 Collecting dashboard timings at http://{HOST}:{PORT}{PATH} into {LOG_FILE}")
+    async with server:
+        await server.serve_forever()
+
+def main():
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        print("\n👋 Collector stopped")
+    return True
+
+if __name__ == "__main__":
+    success = main()
+    exit(0 if success else 1)
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Pre-render the default tab's table into index.html for an instant first paint
+
+The Individual tab is visible on load, so its benchmark row and first rows are
+rendered here with the same markup and number formatting as
+createMacroIndividualTable() and written into <tbody id="individual-tbody">.
+They show before any script runs. The tbody is tagged with the shard the rows
+came from; once that shard has loaded, the windowed table adopts the rows and
+only appends the rest of its window. If the data has changed since, the tag no
+longer matches and the table is rendered normally.
+
+Run after build_shards.py (which rewrites the data index the tag refers to).
+"""
+
+import json
+import re
+from decimal import Decimal, ROUND_HALF_UP
+from itertools import islice
+
+from dashboard_io import iter_records
+from js_literals import extract_const_literals
+
+HTML_FILE = 'index.html'
+DATA_FILE = 'dashboard_data.json'
+TBODY_ID = 'individual-tbody'
+SECTION = 'individualData'
+# About one screen of rows; the table fills in the rest of its window when it loads
+PRERENDER_ROWS = 20
+
+def js_fixed(value, digits):
+    """Number.prototype.toFixed: exact binary value, ties rounded away from zero"""
+    if value != value:
+        return 'NaN'
+    if value == 0:
+        value = 0.0  # (-0).toFixed() has no sign
+    return str(Decimal(value).quantize(Decimal(1).scaleb(-digits), rounding=ROUND_HALF_UP))
+
+def js_string(value):
+    """String(value) for the JSON values the templates interpolate"""
+    if value is None:
+        return 'undefined'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+def format_currency(value):
+    """Same output as formatCurrency() in index.html"""
+    if value is None:
+        return '$0.0'
+    for threshold, suffix in ((1e12, 'T'), (1e9, 'B'), (1e6, 'M'), (1e3, 'K')):
+        if value >= threshold:
+            return f"${js_fixed(value / threshold, 1)}{suffix}"
+    return f"${js_fixed(value, 1)}"
+
+def _percent(value):
+    return f"{js_fixed(value * 100, 1)}%"
+
+def _or(item, field, fallback):
+    """item.field || fallback, as in the table templates"""
+    value = item.get(field)
+    return value if value else fallback
+
+def tooltip(text, description):
+    return f'<span class="tooltip">{text}<span class="tooltiptext">{description}</span></span>'
+
+def render_benchmark_row(benchmark):
+    """Benchmark row of createMacroIndividualTable()"""
+    cells = [
+        '<td class="indicator-column"><strong>SPY Buy & Hold Benchmark</strong></td>',
+        '<td class="transform-column"><strong>Buy & Hold</strong></td>',
+        f"<td><strong>{format_currency(benchmark['terminal_value'])}</strong></td>",
+        f"<td><strong>{_percent(benchmark['annual_return'])}</strong></td>",
+        f"<td><strong>{_percent(benchmark['volatility'])}</strong></td>",
+        f"<td><strong>{_percent(benchmark['max_drawdown'])}</strong></td>",
+        f"<td><strong>{js_fixed(benchmark['sharpe_ratio'], 2)}</strong></td>",
+        f"<td><strong>{js_fixed(benchmark['sortino_ratio'], 2)}</strong></td>",
+        f"<td><strong>{js_fixed(benchmark['calmar_ratio'], 2)}</strong></td>",
+        f"<td><strong>{_percent(benchmark['win_rate'])}</strong></td>",
+        '<td><strong>-</strong></td>',
+        '<td><strong>-</strong></td>',
+    ]
+    return f'<tr class="benchmark-row">{"".join(cells)}</tr>'
+
+def render_individual_row(item, descriptions):
+    """Strategy row of createMacroIndividualTable()"""
+    indicator = item.get('indicator')
+    description = descriptions.get(indicator) or descriptions['DEFAULT']
+    sharpe = item['sharpe_ratio']
+    cells = [
+        f'<td class="indicator-column">{tooltip(js_string(indicator), description)}</td>',
+        f'<td class="transform-column">{js_string(item.get("transform_type"))}</td>',
+        f"<td>{format_currency(item.get('terminal_value'))}</td>",
+        f"<td>{_percent(item['annual_return'])}</td>",
+        f"<td>{_percent(item['volatility'])}</td>",
+        f"<td>{_percent(item['max_drawdown'])}</td>",
+        f"<td>{js_fixed(sharpe, 2)}</td>",
+        f"<td>{js_fixed(_or(item, 'sortino_ratio', sharpe * 1.1), 2)}</td>",
+        f"<td>{js_fixed(_or(item, 'calmar_ratio', sharpe * 0.8), 2)}</td>",
+        f"<td>{_percent(item['win_rate'])}</td>",
+        f"<td>{js_string(item.get('total_trades'))}</td>",
+        f"<td>{js_fixed(_or(item, 'avg_trades_per_year', item['total_trades'] / 15), 1)}</td>",
+    ]
+    return f'<tr>{"".join(cells)}</tr>'
+
+def load_data_index(html):
+    index_url = re.search(r"const DATA_INDEX_URL = '([^']*)';", html).group(1)
+    with open(index_url, 'r') as f:
+        return json.load(f)
+
+def prerender(html, records, benchmark, source, descriptions):
+    """Return html with the individual tbody filled in and tagged with its source shard"""
+    rows = [render_benchmark_row(benchmark)] + [render_individual_row(item, descriptions) for item in records]
+    tbody = (f'<tbody id="{TBODY_ID}" data-source="{source}" data-prerendered="{len(records)}">'
+             + ''.join(rows) + '</tbody>')
+    pattern = re.compile(rf'<tbody id="{TBODY_ID}"[^>]*>.*?</tbody>', re.DOTALL)
+    if not pattern.search(html):
+        raise ValueError(f"No <tbody id=\"{TBODY_ID}\"> in {HTML_FILE}")
+    return pattern.sub(lambda match: tbody, html, count=1)
+
+def main():
+    print("🔧 Pre-rendering the default table into index.html...")
+
+    with open(HTML_FILE, 'r') as f:
+        html = f.read()
+
+    index = load_data_index(html)
+    entry = index['sections'].get(SECTION)
+    benchmark = index['objects'].get('spyBenchmark')
+    if entry is None or benchmark is None:
+        print(f"❌ Data index has no {SECTION} shard or spyBenchmark; run build_shards.py first")
+        return False
+
+    literals, errors = extract_const_literals(html, ['macroDescriptions'])
+    if 'macroDescriptions' not in literals:
+        print(f"❌ Could not read macroDescriptions from {HTML_FILE}: {errors.get('macroDescriptions')}")
+        return False
+
+    records = list(islice(iter_records(DATA_FILE, SECTION), PRERENDER_ROWS))
+    updated = prerender(html, records, benchmark, entry['file'], literals['macroDescriptions'])
+
+    if updated != html:
+        with open(HTML_FILE, 'w') as f:
+            f.write(updated)
+        print(f"💾 Pre-rendered benchmark + {len(records)} rows of {SECTION} ({entry['file']})")
+    else:
+        print("✅ Pre-rendered rows already up to date")
+
+    return True
+
+if __name__ == "__main__":
+    success = main()
+    exit(0 if success else 1)
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Reproducible random streams for the data build
+
+Everything random in the build draws from a named stream derived from one build
+seed with numpy's SeedSequence: the stream names (a section, optionally a
+normalization pass) become the spawn key. A stream never depends on which other
+streams exist or the order they are used in, so identical inputs give identical
+artifacts and sections can be generated in any order or in parallel.
+
+Change BUILD_SEED to draw a different, equally reproducible, data set.
+"""
+
+import random
+import zlib
+
+import numpy as np
+
+BUILD_SEED = 20100101
+
+def _stream_key(name):
+    return zlib.crc32(name.encode('utf-8'))
+
+def stream_seed(*names, build_seed=BUILD_SEED):
+    """SeedSequence for the stream identified by names, e.g. ('spyMLData',)"""
+    return np.random.SeedSequence(build_seed, spawn_key=tuple(_stream_key(name) for name in names))
+
+def numpy_rng(*names, build_seed=BUILD_SEED):
+    """numpy Generator for a named stream"""
+    return np.random.default_rng(stream_seed(*names, build_seed=build_seed))
+
+def python_rng(*names, build_seed=BUILD_SEED):
+    """random.Random for a named stream, for code written against the random module API"""
+    state = stream_seed(*names, build_seed=build_seed).generate_state(4)
+    return random.Random(int.from_bytes(state.tobytes(), 'little'))
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Columnar strategy table backed by NumPy arrays
+
+Each metric (terminal_value, annual_return, sharpe_ratio, ...) is one array, so
+generation and perturbation are single vectorized operations. Row dicts are
+only built when the table is iterated for serialization.
+"""
+
+import numpy as np
+
+METRIC_COLUMNS = [
+    'terminal_value', 'annual_return', 'volatility', 'max_drawdown',
+    'sharpe_ratio', 'sortino_ratio', 'calmar_ratio', 'win_rate',
+    'total_trades', 'avg_trades_per_year'
+]
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+def _column_from_values(values):
+    """Pick the tightest array type for a list of JSON values (None = missing)"""
+    present = [v for v in values if v is not None]
+    if present and all(_is_number(v) for v in present):
+        if len(present) == len(values) and all(isinstance(v, int) for v in present):
+            return np.array(values, dtype=np.int64)
+        return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+    return np.array(values, dtype=object)
+
+
+class StrategyTable:
+    """Ordered mapping of column name -> equal-length NumPy array"""
+
+    def __init__(self, columns=None):
+        self.columns = {}
+        self.length = None
+        for name, values in (columns or {}).items():
+            self[name] = values
+
+    @classmethod
+    def from_records(cls, records, fields=None):
+        """Build a table from row dicts; missing numeric values become NaN"""
+        if isinstance(records, StrategyTable):
+            return records
+        records = list(records)
+        if fields is None:
+            fields = {}
+            for record in records:
+                for field in record:
+                    fields.setdefault(field, None)
+        return cls({field: _column_from_values([r.get(field) for r in records]) for field in fields})
+
+    def __len__(self):
+        return self.length or 0
+
+    def __contains__(self, name):
+        return name in self.columns
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def __setitem__(self, name, values):
+        if np.isscalar(values) and self.length is not None:
+            values = np.full(self.length, values, dtype=object if isinstance(values, str) else None)
+        values = np.asarray(values)
+        if values.dtype.kind == 'U':
+            values = values.astype(object)
+        if self.length is None:
+            self.length = len(values)
+        elif len(values) != self.length:
+            raise ValueError(f"Column {name!r} has {len(values)} rows, table has {self.length}")
+        self.columns[name] = values
+
+    def get(self, name, default):
+        """Column with missing (absent or NaN) values filled from default"""
+        if name not in self.columns:
+            return np.broadcast_to(default, (len(self),)).copy()
+        values = self.columns[name]
+        if values.dtype.kind == 'f':
+            return np.where(np.isnan(values), default, values)
+        return values
+
+    def take(self, indices):
+        """New table with the given rows, in the given order"""
+        return StrategyTable({name: values[indices] for name, values in self.columns.items()})
+
+    def head(self, n):
+        return self.take(slice(0, n))
+
+    def cycle(self, n):
+        """First n rows, wrapping around when n exceeds the table length"""
+        return self.take(np.arange(n) % len(self))
+
+    def argsort(self, name, descending=False):
+        order = np.argsort(self.columns[name], kind='stable')
+        return order[::-1] if descending else order
+
+    def perturb(self, factors, rng):
+        """Multiply columns by per-row uniform factors: {column: (low, high)}"""
+        return {name: self[name] * rng.uniform(low, high, len(self)) for name, (low, high) in factors.items()}
+
+    def to_records(self):
+        """Yield one plain dict per row (the serialization boundary)"""
+        names = list(self.columns)
+        lists = []
+        sparse = False
+        for values in self.columns.values():
+            if values.dtype.kind == 'f' and np.isnan(values).any():
+                values = np.where(np.isnan(values), None, values.astype(object))
+                sparse = True
+            lists.append(values.tolist())
+        for row in zip(*lists):
+            if sparse:
+                yield {name: value for name, value in zip(names, row) if value is not None}
+            else:
+                yield dict(zip(names, row))
+
+    def __iter__(self):
+        return self.to_records()
+
+
+def uniform_columns(ranges, n, rng):
+    """Draw independent uniform columns: {column: (low, high)}"""
+    return {name: rng.uniform(low, high, n) for name, (low, high) in ranges.items()}
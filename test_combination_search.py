@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Check the branch-and-bound combination search against brute force
+
+Random signal sets with positive, negative and mixed mean returns are searched
+both ways; the pruned search must return exactly the brute-force top-K.
+"""
+
+from itertools import combinations
+
+import numpy as np
+
+import combination_search
+from combination_search import MAX_CORRELATION, _init_worker, search, search_roots
+from metrics import PERIODS_PER_YEAR
+
+TRIALS = 200
+SIGNALS = 14
+SIZES = (3, 4)
+TOP_K = 10
+
+def random_signals(rng, mean_shift):
+    """(means, covariance, indicators) for SIGNALS correlated return series, sorted by descending mean"""
+    factors = rng.normal(size=(3, 250))
+    returns = rng.normal(scale=0.01, size=(SIGNALS, 250)) + rng.uniform(0, 0.01, (SIGNALS, 3)) @ factors
+    returns += rng.uniform(-0.001, 0.001, (SIGNALS, 1)) + mean_shift
+    means, covariance = combination_search.return_moments(returns, np.arange(SIGNALS))
+    order = np.argsort(-means, kind='stable')
+    indicators = np.array([f"I{i}" for i in rng.integers(0, SIGNALS - 3, SIGNALS)], dtype=object)
+    return means[order], covariance[np.ix_(order, order)], indicators[order]
+
+def brute_force(means, covariance, indicators):
+    std = np.sqrt(np.diag(covariance))
+    correlation = covariance / np.outer(std, std)
+    found = []
+    for size in SIZES:
+        for combo in combinations(range(len(means)), size):
+            if any(indicators[i] == indicators[j] or correlation[i, j] > MAX_CORRELATION
+                   for i, j in combinations(combo, 2)):
+                continue
+            variance = covariance[np.ix_(combo, combo)].sum()
+            found.append((means[list(combo)].sum() / np.sqrt(variance) * np.sqrt(PERIODS_PER_YEAR), combo))
+    return sorted(found, reverse=True)[:TOP_K]
+
+def pruned(means, covariance, indicators):
+    _init_worker(means, covariance, indicators, SIZES, TOP_K, MAX_CORRELATION)
+    heap, _ = search_roots(range(len(means)))
+    return sorted(heap, reverse=True)
+
+def assert_same(expected, actual):
+    assert [combo for _, combo in actual] == [combo for _, combo in expected]
+    assert np.allclose([sharpe for sharpe, _ in actual], [sharpe for sharpe, _ in expected])
+
+def test_matches_brute_force():
+    rng = np.random.default_rng(7)
+    for trial in range(TRIALS):
+        # Positive, all-negative and mixed mean returns
+        signals = random_signals(rng, [0.0005, -0.002, 0.0][trial % 3])
+        assert_same(brute_force(*signals), pruned(*signals))
+
+def test_worker_pool_matches_brute_force():
+    signals = random_signals(np.random.default_rng(11), -0.002)
+    best, _ = search(*signals, sizes=SIZES, top_k=TOP_K, max_workers=2)
+    assert_same(brute_force(*signals), best)
+
+def main():
+    print("🔍 Comparing the combination search with brute force...")
+    test_matches_brute_force()
+    test_worker_pool_matches_brute_force()
+    print(f"✅ {TRIALS} random signal sets and the worker pool match brute force")
+    return True
+
+if __name__ == "__main__":
+    success = main()
+    exit(0 if success else 1)
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Check every dashboard table in headless Chromium against a local static server
+
+The site (dist/ when build_dist.py has run, else the source tree) is served by
+an in-process asyncio HTTP server on a free port, and every request to any
+other host is blocked, so the check needs no network. Nothing sleeps for a
+fixed time. Each check waits for the page's own readiness signals instead:
+
+- <html data-dashboard="..."> once the initial load has finished;
+- data-rows on a table's tbody once that table has rendered.
+
+The tables to check come from the page itself: every entry of its TABLES
+registry whose panel and tbody exist in the DOM, opened by clicking the tab
+buttons that lead to the panel (found by their onclick). Registry entries
+without markup are listed as not on the page rather than checked. Each table
+is opened in its own browser context, MAX_CONTEXTS at a time. A table passes
+when its row count matches the data index and its page logged no errors.
+"""
+
+import asyncio
+import mimetypes
+import os
+import time
+from urllib.parse import unquote, urlsplit
+
+from playwright.async_api import async_playwright
+
+HOST = '127.0.0.1'
+SITE_DIRS = ['dist', '.']  # first directory with an index.html is served
+MAX_CONTEXTS = 8
+READY_TIMEOUT = 15000  # ms; a limit for failures, not a wait
+
+# TABLES entries on the page -> [panel id, onclick of the button that opens it (null if none)] for each
+# tab panel around the table, outermost first. showSubTab('macro', 'ml') opens #macro-ml, and so on.
+DISCOVER_TABLES_JS = """() => {
+    const openers = {};
+    document.querySelectorAll('button[onclick^="show"]').forEach(button => {
+        const onclick = button.getAttribute('onclick');
+        openers[Array.from(onclick.matchAll(/'([^']*)'/g), match => match[1]).join('-')] = onclick;
+    });
+    const checks = {};
+    const absent = [];
+    Object.entries(TABLES).forEach(([tableId, table]) => {
+        const panel = document.getElementById(table.panel);
+        if (!panel || !document.getElementById(`${tableId}-tbody`)) {
+            absent.push(tableId);
+            return;
+        }
+        const clicks = [];
+        for (let element = panel; element; element = element.parentElement) {
+            if (/(^|\\s)(sub-)*tab-content(\\s|$)/.test(element.className)) {
+                clicks.unshift([element.id, openers[element.id] || null]);
+            }
+        }
+        checks[tableId] = clicks;
+    });
+    return { checks: checks, absent: absent };
+}"""
+
+# Rows the data index promises for a table (null when the page loaded the single data file)
+EXPECTED_ROWS_JS = """tableId => dataIndex
+    ? TABLES[tableId].sections.reduce((rows, name) => Math.max(rows, (dataIndex.sections[name] || {rows: 0}).rows), 0)
+    : null"""
+
+def site_dir():
+    for directory in SITE_DIRS:
+        if os.path.exists(os.path.join(directory, 'index.html')):
+            return os.path.abspath(directory)
+    return None
+
+async def serve_file(root, reader, writer):
+    """Answer one GET/HEAD request from root, preferring a precompressed .gz sibling"""
+    try:
+        head = await reader.readuntil(b'\r\n\r\n')
+        lines = head.decode('latin-1').split('\r\n')
+        method, target, _ = lines[0].split(' ', 2)
+        headers = {k.strip().lower(): v.strip() for k, _, v in (line.partition(':') for line in lines[1:] if line)}
+
+        path = unquote(urlsplit(target).path)
+        if path.endswith('/'):
+            path += 'index.html'
+        file_path = os.path.realpath(os.path.join(root, path.lstrip('/')))
+        if method not in ('GET', 'HEAD') or not file_path.startswith(root + os.sep) or not os.path.isfile(file_path):
+            status, body, extra = '404 Not Found', b'Not found', {}
+        else:
+            extra = {'Content-Type': mimetypes.guess_type(file_path)[0] or 'application/octet-stream'}
+            if 'gzip' in headers.get('accept-encoding', '') and os.path.isfile(f"{file_path}.gz"):
+                file_path = f"{file_path}.gz"
+                extra['Content-Encoding'] = 'gzip'
+            with open(file_path, 'rb') as f:
+                body = f.read()
+            status = '200 OK'
+
+        response = [f"HTTP/1.1 {status}", f"Content-Length: {len(body)}", "Connection: close", "Cache-Control: no-store"]
+        response += [f"{name}: {value}" for name, value in extra.items()]
+        writer.write(('\r\n'.join(response) + '\r\n\r\n').encode('latin-1'))
+        if method != 'HEAD':
+            writer.write(body)
+        await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+        pass
+    finally:
+        writer.close()
+
+async def start_server(root):
+    """Static server on a free local port; returns (server, base URL)"""
+    server = await asyncio.start_server(lambda r, w: serve_file(root, r, w), HOST, 0)
+    port = server.sockets[0].getsockname()[1]
+    return server, f"http://{HOST}:{port}"
+
+async def open_dashboard(browser, base_url, errors):
+    """Fresh context and page, loaded until the dashboard is ready; errors collects page errors"""
+    context = await browser.new_context()
+
+    async def local_only(route):
+        if route.request.url.startswith(base_url):
+            await route.continue_()
+        else:
+            errors.append(f"blocked external request: {route.request.url}")
+            await route.abort()
+
+    await context.route('**/*', local_only)
+    page = await context.new_page()
+    page.on('pageerror', lambda error: errors.append(str(error)))
+    page.on('console', lambda message: errors.append(message.text) if message.type == 'error' else None)
+    await page.goto(f"{base_url}/index.html", wait_until='domcontentloaded')
+    await page.wait_for_function("document.documentElement.hasAttribute('data-dashboard')", timeout=READY_TIMEOUT)
+    return context, page
+
+async def discover_tables(browser, base_url):
+    """({table id: clicks}, [TABLES ids without a panel or tbody]) as found in the loaded page"""
+    context, page = await open_dashboard(browser, base_url, [])
+    try:
+        found = await page.evaluate(DISCOVER_TABLES_JS)
+    finally:
+        await context.close()
+    return found['checks'], found['absent']
+
+async def check_table(browser, base_url, table_id, clicks, limit):
+    """Open one table in a fresh context; returns a result dict"""
+    async with limit:
+        started = time.perf_counter()
+        errors = []
+        context = None
+
+        result = {'table': table_id, 'rows': None, 'expected': None, 'mode': None, 'errors': errors}
+        try:
+            context, page = await open_dashboard(browser, base_url, errors)
+            result['mode'] = await page.get_attribute('html', 'data-dashboard')
+
+            for panel, onclick in clicks:
+                if onclick is None:
+                    raise LookupError(f"no tab button opens #{panel}")
+                await page.click(f'button[onclick="{onclick}"]', timeout=READY_TIMEOUT)
+            tbody = f"#{table_id}-tbody"
+            await page.wait_for_selector(f"{tbody}[data-rows]", state='attached', timeout=READY_TIMEOUT)
+            result['rows'] = int(await page.get_attribute(tbody, 'data-rows'))
+            result['expected'] = await page.evaluate(EXPECTED_ROWS_JS, table_id)
+            result['visible'] = await page.locator(f"{tbody} tr:not(.virtual-spacer)").count()
+        except Exception as e:
+            errors.append(f"{type(e).__name__}: {str(e).splitlines()[0]}")
+        finally:
+            if context is not None:
+                await context.close()
+
+        result['seconds'] = time.perf_counter() - started
+        result['ok'] = (not errors and result['mode'] in ('shards', 'full') and result['rows'] is not None
+                        and result['expected'] in (None, result['rows']))
+        return result
+
+async def verify_dashboard():
+    print("🎯 Dashboard verification (local server, parallel contexts)")
+    print("=" * 50)
+
+    root = site_dir()
+    if root is None:
+        print(f"❌ No index.html in any of {SITE_DIRS}")
+        return False
+
+    started = time.perf_counter()
+    server, base_url = await start_server(root)
+    print(f"🌐 Serving {os.path.relpath(root)} at {base_url}")
+
+    try:
+        async with async_playwright() as playwright:
+            browser = await playwright.chromium.launch(headless=True)
+            checks, absent = await discover_tables(browser, base_url)
+            limit = asyncio.Semaphore(MAX_CONTEXTS)
+            results = await asyncio.gather(*(check_table(browser, base_url, table_id, clicks, limit)
+                                             for table_id, clicks in checks.items()))
+            await browser.close()
+    finally:
+        server.close()
+        await server.wait_closed()
+
+    for result in results:
+        marker = "✅" if result['ok'] else "❌"
+        expected = "" if result['expected'] is None else f" / {result['expected']} expected"
+        print(f"{marker} {result['table']}: {result['rows']} rows{expected} ({result['seconds']:.2f}s)")
+        for error in result['errors']:
+            print(f"    ⚠️  {error}")
+
+    for table_id in absent:
+        print(f"➖ {table_id}: not on this page (no panel or tbody)")
+
+    passed = sum(result['ok'] for result in results)
+    print(f"\n🎯 {passed}/{len(results)} tables passed in {time.perf_counter() - started:.1f}s")
+    return bool(results) and passed == len(results)
+
+if __name__ == "__main__":
+    result = asyncio.run(verify_dashboard())
+    exit(0 if result else 1)